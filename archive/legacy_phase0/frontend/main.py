@@ -1,14 +1,50 @@
 """
-Frontend Service - Flask Application
+Frontend Service - Quart Application
 Provides a simple web interface that communicates with the backend service.
 Includes a chat interface for the Panelin BMC Uruguay assistant.
+
+Runs under an ASGI server (hypercorn) so a single worker overlaps many
+in-flight backend calls instead of holding a thread for each one.
 """
 
 import os
-from flask import Flask, jsonify, render_template, request
-import requests
+import httpx
+from quart import Quart, Response, abort, jsonify, render_template, request
+from quart.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import RequestEntityTooLarge
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson for jsonify() and request.get_json().
+    Keeps Quart's sorted keys and falls back to its default() for types
+    orjson does not handle the same way (e.g. dates as HTTP dates).
+    """
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
-app = Flask(__name__)
+
+app = Quart(__name__)
+if HAS_ORJSON:
+    app.json = OrjsonProvider(app)
+# Reject oversized chat bodies before they are buffered and JSON-parsed.
+# A 5000-character message is at most ~60 KB even when every character
+# is sent as an escaped surrogate pair (12 bytes), so 64 KB never rejects
+# a message that would pass the length check.
+app.config['MAX_CONTENT_LENGTH'] = 64 * 1024
 
 # Configuration from environment variables
 PORT = int(os.environ.get('PORT', 8080))
@@ -18,24 +54,125 @@ BACKEND_SERVICE_URL = os.environ.get(
     'http://backend-service.default.svc.run.internal'
 )
 
+# Timeouts: fail fast when the backend is unreachable, but give AI chat
+# processing time to answer
+STATUS_TIMEOUT = httpx.Timeout(10.0, connect=2.0)
+CHAT_TIMEOUT = httpx.Timeout(30.0, connect=2.0)
+
+# Shared async client so requests to the backend reuse pooled keep-alive
+# connections; created and closed with the server's event loop
+CLIENT = None
+
+
+def _encode_json(obj):
+    """
+    Encode a static response body once, the same way jsonify() does.
+    """
+    return (app.json.dumps(obj, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def _json_response(body, status):
+    """
+    Wrap a pre-encoded JSON body in a response.
+    """
+    return Response(body, status=status, mimetype='application/json')
+
+
+# Static chat error/fallback bodies, encoded once at import. When the
+# backend is down these are returned on every request.
+NO_MESSAGE_BODY = _encode_json({
+    'status': 'error',
+    'message': 'No message provided'
+})
+MESSAGE_TOO_LONG_BODY = _encode_json({
+    'status': 'error',
+    'message': 'Message too long. Maximum 5000 characters allowed.'
+})
+BACKEND_DOWN_BODY = _encode_json({
+    'status': 'success',
+    'response': (
+        "El servicio backend no está disponible en este momento. "
+        "Por favor, intenta nuevamente más tarde."
+    ),
+    'backend_available': False
+})
+BACKEND_TIMEOUT_BODY = _encode_json({
+    'status': 'success',
+    'response': (
+        "El servicio está tardando más de lo esperado. "
+        "Por favor, intenta nuevamente."
+    ),
+    'backend_available': False
+})
+CHAT_ERROR_BODY = _encode_json({
+    'status': 'error',
+    'message': 'Error al procesar el mensaje.'
+})
+HEALTH_BODY = _encode_json({
+    'status': 'healthy',
+    'service': 'frontend'
+})
+
+# chat.html has no per-request context, so it is rendered once at startup
+# and served from memory instead of going through Jinja on every hit
+CHAT_HTML = b''
+
+
+@app.before_serving
+async def startup():
+    """
+    Open the backend client and pre-render the chat page.
+    """
+    global CLIENT, CHAT_HTML
+    CLIENT = httpx.AsyncClient(
+        base_url=BACKEND_SERVICE_URL,
+        timeout=CHAT_TIMEOUT,
+        # Connect failures are retried once; requests are never replayed
+        transport=httpx.AsyncHTTPTransport(
+            retries=1,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=64),
+        ),
+    )
+    CHAT_HTML = (await render_template('chat.html')).encode('utf-8')
+
+
+@app.after_serving
+async def shutdown():
+    """
+    Close pooled backend connections.
+    """
+    await CLIENT.aclose()
+
+
+@app.errorhandler(413)
+async def request_entity_too_large(e):
+    """
+    Report bodies over MAX_CONTENT_LENGTH like any other oversized message.
+    """
+    return _json_response(MESSAGE_TOO_LONG_BODY, 400)
+
 
 @app.route('/')
-def index():
+async def index():
     """
     Main route that serves the chat interface.
     """
-    return render_template('chat.html')
+    return Response(
+        CHAT_HTML,
+        mimetype='text/html',
+        headers={'Cache-Control': 'public, max-age=300'}
+    )
 
 
 @app.route('/api/status')
-def status():
+async def status():
     """
     Status endpoint that fetches data from the backend service.
     Includes error handling for when backend is unavailable.
     """
     try:
         # Make request to backend service
-        response = requests.get(f"{BACKEND_SERVICE_URL}/api/data", timeout=10)
+        response = await CLIENT.get('/api/data', timeout=STATUS_TIMEOUT)
         response.raise_for_status()
         
         backend_data = response.json()
@@ -46,21 +183,21 @@ def status():
             'backend_response': backend_data
         }), 200
         
-    except requests.exceptions.ConnectionError:
+    except (httpx.ConnectError, httpx.ConnectTimeout):
         return jsonify({
             'status': 'error',
             'message': 'Cannot connect to backend service',
             'backend_url': BACKEND_SERVICE_URL
         }), 503
         
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         return jsonify({
             'status': 'error',
             'message': 'Backend service timeout',
             'backend_url': BACKEND_SERVICE_URL
         }), 504
         
-    except requests.exceptions.RequestException as e:
+    except (httpx.HTTPError, ValueError) as e:
         return jsonify({
             'status': 'error',
             'message': f'Error communicating with backend: {str(e)}',
@@ -69,82 +206,75 @@ def status():
 
 
 @app.route('/api/chat', methods=['POST'])
-def chat():
+async def chat():
     """
     Chat endpoint that processes user messages via backend service.
     Integrates with backend AI processing and conversation storage.
     """
+    if (request.content_length or 0) > app.config['MAX_CONTENT_LENGTH']:
+        abort(413)
+
     try:
-        data = request.get_json()
+        data = await request.get_json()
         user_message = data.get('message', '')
         user_id = data.get('user_id', 'anonymous')
         
         if not user_message:
-            return jsonify({
-                'status': 'error',
-                'message': 'No message provided'
-            }), 400
+            return _json_response(NO_MESSAGE_BODY, 400)
         
         # Validate message length
         if len(user_message) > 5000:
-            return jsonify({
-                'status': 'error',
-                'message': 'Message too long. Maximum 5000 characters allowed.'
-            }), 400
+            return _json_response(MESSAGE_TOO_LONG_BODY, 400)
         
         # Forward to backend service
         try:
-            response = requests.post(
-                f"{BACKEND_SERVICE_URL}/api/chat",
-                json={'message': user_message, 'user_id': user_id},
-                timeout=30
+            response = await CLIENT.post(
+                '/api/chat',
+                json={'message': user_message, 'user_id': user_id}
             )
+            # Pass JSON replies through as-is instead of parsing and
+            # re-serializing them; anything else goes through the old path
+            content_type = response.headers.get('Content-Type', '')
+            if content_type.startswith('application/json'):
+                return Response(
+                    response.content,
+                    status=response.status_code,
+                    content_type=content_type
+                )
+
             backend_data = response.json()
 
             return jsonify(backend_data), response.status_code
             
-        except requests.exceptions.ConnectionError:
+        except (httpx.ConnectError, httpx.ConnectTimeout):
             # Fallback response if backend is unavailable
-            return jsonify({
-                'status': 'success',
-                'response': (
-                    "El servicio backend no está disponible en este momento. "
-                    "Por favor, intenta nuevamente más tarde."
-                ),
-                'backend_available': False
-            }), 200
+            return _json_response(BACKEND_DOWN_BODY, 200)
             
-        except requests.exceptions.Timeout:
-            return jsonify({
-                'status': 'success',
-                'response': (
-                    "El servicio está tardando más de lo esperado. "
-                    "Por favor, intenta nuevamente."
-                ),
-                'backend_available': False
-            }), 200
+        except httpx.TimeoutException:
+            return _json_response(BACKEND_TIMEOUT_BODY, 200)
         
+    except RequestEntityTooLarge:
+        # Bodies without a Content-Length hit the limit while being read
+        raise
     except Exception as e:
         print(f"Error processing chat: {str(e)}")
-        return jsonify({
-            'status': 'error',
-            'message': 'Error al procesar el mensaje.'
-        }), 500
+        return _json_response(CHAT_ERROR_BODY, 500)
 
 
 @app.route('/health')
-def health():
+async def health():
     """
     Health check endpoint for Cloud Run.
     Returns 200 OK if the service is running.
     """
-    return jsonify({
-        'status': 'healthy',
-        'service': 'frontend'
-    }), 200
+    return Response(
+        HEALTH_BODY,
+        mimetype='application/json',
+        headers={'Cache-Control': 'no-store'}
+    )
 
 
 if __name__ == '__main__':
-    # Run the Flask application
+    # Local development server; production runs under hypercorn (see Dockerfile)
     # Cloud Run will set PORT environment variable
     app.run(host='0.0.0.0', port=PORT)
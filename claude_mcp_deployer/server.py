@@ -5,12 +5,16 @@ Enables automatic GPT deployment when Claude Desktop is opened
 """
 
 import asyncio
+import functools
 import json
 import os
+import re
 import subprocess
 import sys
+import time
+from collections import deque
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 # MCP SDK imports
 try:
@@ -21,113 +25,315 @@ except ImportError:
     print("Error: MCP SDK not installed. Run: pip install mcp", file=sys.stderr)
     sys.exit(1)
 
+# HTTP client for the GitHub API
+try:
+    import httpx
+except ImportError:
+    print("Error: httpx not installed. Run: pip install httpx", file=sys.stderr)
+    sys.exit(1)
+
+# Optional fast JSON backend
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Repository root
 REPO_ROOT = Path(__file__).parent.parent.resolve()
 DEPLOY_PACKAGE_DIR = REPO_ROOT / "GPT_Deploy_Package"
 
+# String forms for os-level calls in the handlers, computed once
+REPO_ROOT_STR = os.fspath(REPO_ROOT)
+DEPLOY_PACKAGE_DIR_STR = os.fspath(DEPLOY_PACKAGE_DIR)
+
+# Knowledge base upload order (phase label, files relative to REPO_ROOT)
+UPLOAD_SEQUENCE: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Phase 1 - Master Knowledge Base [CRITICAL]", (
+        "BMC_Base_Conocimiento_GPT-2.json",
+        "bromyros_pricing_master.json",
+        "accessories_catalog.json",
+        "bom_rules.json"
+    )),
+    ("Phase 2 - Optimized Lookups [CRITICAL]", (
+        "bromyros_pricing_gpt_optimized.json",
+        "shopify_catalog_v1.json",
+        "shopify_catalog_index_v1.csv"
+    )),
+    ("Phase 3 - Validation", (
+        "BMC_Base_Unificada_v4.json",
+        "panelin_truth_bmcuruguay_web_only_v2.json"
+    )),
+    ("Phase 4 - Documentation", (
+        "Aleros -2.rtf",
+        "panelin_context_consolidacion_sin_backend.md",
+        "PANELIN_KNOWLEDGE_BASE_GUIDE.md",
+        "PANELIN_QUOTATION_PROCESS.md",
+        "PANELIN_TRAINING_GUIDE.md",
+        "GPT_INSTRUCTIONS_PRICING.md",
+        "GPT_PDF_INSTRUCTIONS.md",
+        "GPT_OPTIMIZATION_ANALYSIS.md",
+        "README.md"
+    )),
+    ("Phase 5 - Supporting Files", (
+        "Instrucciones GPT.rtf",
+        "Panelin_GPT_config.json"
+    )),
+    ("Phase 6 - Assets", (
+        "bmc_logo.png",
+    )),
+)
+UPLOAD_FILES = frozenset(f for _, files in UPLOAD_SEQUENCE for f in files)
+
+
+def _escape_braces(text: str) -> str:
+    """Escape literal braces for use in a str.format template"""
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _build_upload_listing_template() -> tuple[str, tuple[str, ...]]:
+    """Render the static upload listing once, leaving a {} slot for each file's status"""
+    output = ["📂 File Upload Sequence", ""]
+    files_in_order = []
+    
+    for phase, files in UPLOAD_SEQUENCE:
+        output.append("\n" + _escape_braces(phase))
+        output.append(f"Files: {len(files)}")
+        for f in files:
+            output.append("  {} " + _escape_braces(f))
+            files_in_order.append(f)
+        
+        # Add pause instructions
+        if "Phase 1" in phase:
+            output.append("\n⏱️  PAUSE 2-3 MINUTES after uploading Phase 1")
+        elif "Phase 6" not in phase:
+            output.append("\n⏱️  PAUSE 2 MINUTES after uploading this phase")
+    
+    return "\n".join(output), tuple(files_in_order)
+
+
+UPLOAD_LISTING_TEMPLATE, UPLOAD_FILES_IN_ORDER = _build_upload_listing_template()
+
+# Prompt section of CLAUDE_COMPUTER_USE_AUTOMATION.md, up to the first "---"
+# that starts at least 100 characters after the heading
+PROMPT_SECTION_RE = re.compile(r"Comprehensive Prompt Template.{71,}?(?=---)", re.DOTALL)
+
+# How long list_files_to_upload reuses a presence snapshot (missing files stay missing)
+UPLOAD_PRESENCE_TTL_SECONDS = 10.0
+
+# autoconfig_gpt.py output kept for the response, and per-line read limit
+OUTPUT_TAIL_LINES = 200
+SUBPROCESS_LINE_LIMIT = 1024 * 1024
+
+# GitHub Actions workflow that builds the deployment package. The repository
+# comes from $GITHUB_REPOSITORY or, failing that, the checkout's origin remote
+GITHUB_REMOTE_RE = re.compile(r"github\.com[:/]([^/]+/[^/]+?)(?:\.git)?/?$")
+GITHUB_WORKFLOW_FILE = "generate-gpt-config.yml"
+GITHUB_API_TIMEOUT_SECONDS = 10.0
+GITHUB_STATUS_TTL_SECONDS = 30.0
+# Shorter reuse for failed queries, so an outage is not re-awaited on every call
+GITHUB_ERROR_TTL_SECONDS = 5.0
+
+# Response templates for the tool handlers
+PACKAGE_STATUS_TEMPLATE = """
+{status}
+{details}
+
+Package location: {package_dir}
+
+Files in package:
+{file_list}
+
+Ready to deploy to OpenAI GPT Builder.
+"""
+
+PACKAGE_MISSING_TEMPLATE = """
+❌ No deployment package found
+
+Package directory does not exist: {package_dir}
+
+Please run 'generate_gpt_config' first or wait for GitHub Actions to complete.
+"""
+
+GENERATE_SUCCESS_TEMPLATE = """
+✅ GPT configuration generated successfully!
+
+Output:
+{stdout}
+
+Package created at: {package_dir}
+
+Next step: Use Computer Use to deploy to OpenAI GPT Builder.
+"""
+
+GENERATE_FAILURE_TEMPLATE = """
+❌ Error generating configuration
+
+Exit code: {returncode}
+
+Error output:
+{stderr}
+
+Output:
+{stdout}
+"""
+
+GITHUB_RUN_TEMPLATE = """
+🔄 Latest GitHub Actions run: {workflow}
+Status: {status} ({conclusion})
+Branch: {branch}
+Updated: {updated_at}
+Run: {url}
+"""
+
+OPENAI_CONFIG_TEMPLATE = """
+📋 OpenAI GPT Configuration
+
+Name: {name}
+
+Description:
+{description}
+
+Capabilities:
+{capabilities}
+
+Conversation Starters:
+{conversation_starters}
+
+Instructions: (see full JSON below)
+
+Full Configuration:
+```json
+{full_json}
+```
+"""
+
 # Create server instance
 server = Server("panelin-gpt-deployer")
 
 
+# Input schema shared by every tool that takes no arguments
+EMPTY_INPUT_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {},
+    "required": []
+}
+
+# Tool definitions are static, so build them once at import time
+TOOLS: list[Tool] = [
+    Tool(
+        name="check_deployment_status",
+        description="Check if GPT configuration is ready for deployment",
+        inputSchema=EMPTY_INPUT_SCHEMA
+    ),
+    Tool(
+        name="generate_gpt_config",
+        description="Generate GPT configuration package using autoconfig_gpt.py",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "auto_approve": {
+                    "type": "boolean",
+                    "description": "Automatically approve configuration (default: true)",
+                    "default": True
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_deployment_guide",
+        description="Get the deployment guide with step-by-step instructions",
+        inputSchema=EMPTY_INPUT_SCHEMA
+    ),
+    Tool(
+        name="get_github_actions_status",
+        description="Check if GitHub Actions has generated a configuration package",
+        inputSchema=EMPTY_INPUT_SCHEMA
+    ),
+    Tool(
+        name="list_files_to_upload",
+        description="List all files that need to be uploaded in phase order",
+        inputSchema=EMPTY_INPUT_SCHEMA
+    ),
+    Tool(
+        name="get_openai_config",
+        description="Get the OpenAI-compatible configuration JSON",
+        inputSchema=EMPTY_INPUT_SCHEMA
+    )
+]
+
+
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List available deployment tools"""
-    return [
-        Tool(
-            name="check_deployment_status",
-            description="Check if GPT configuration is ready for deployment",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="generate_gpt_config",
-            description="Generate GPT configuration package using autoconfig_gpt.py",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "auto_approve": {
-                        "type": "boolean",
-                        "description": "Automatically approve configuration (default: true)",
-                        "default": True
-                    }
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_deployment_guide",
-            description="Get the deployment guide with step-by-step instructions",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_github_actions_status",
-            description="Check if GitHub Actions has generated a configuration package",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="list_files_to_upload",
-            description="List all files that need to be uploaded in phase order",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_openai_config",
-            description="Get the OpenAI-compatible configuration JSON",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        )
-    ]
+    return TOOLS
+
+
+# Tool name -> (handler returning the response text, accepted arguments with defaults)
+TOOL_HANDLERS: dict[str, tuple[Callable[..., Awaitable[str]], dict[str, Any]]] = {}
+
+
+def tool_handler(**arg_defaults: Any) -> Callable[[Callable[..., Awaitable[str]]], Callable[..., Awaitable[str]]]:
+    """Register a coroutine as the handler of the tool with the same name"""
+    def decorator(func: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+        TOOL_HANDLERS[func.__name__] = (func, arg_defaults)
+        return func
+    return decorator
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     """Handle tool calls"""
+    entry = TOOL_HANDLERS.get(name)
+    if entry is None:
+        raise ValueError(f"Unknown tool: {name}")
     
-    if name == "check_deployment_status":
-        return await check_deployment_status()
-    
-    elif name == "generate_gpt_config":
-        auto_approve = arguments.get("auto_approve", True)
-        return await generate_gpt_config(auto_approve)
-    
-    elif name == "get_deployment_guide":
-        return await get_deployment_guide()
-    
-    elif name == "get_github_actions_status":
-        return await get_github_actions_status()
-    
-    elif name == "list_files_to_upload":
-        return await list_files_to_upload()
+    handler, arg_defaults = entry
+    arguments = arguments or {}
+    kwargs = {key: arguments.get(key, default) for key, default in arg_defaults.items()}
+    return [TextContent(type="text", text=await handler(**kwargs))]
+
+
+# Running executions of read-only handlers, keyed by handler name
+_inflight: dict[str, asyncio.Task] = {}
+
+
+def single_flight(func: Callable[[], Awaitable[str]]) -> Callable[[], Awaitable[str]]:
+    """Share one in-flight execution of a read-only handler among concurrent callers"""
+    key = func.__name__
     
-    elif name == "get_openai_config":
-        return await get_openai_config()
+    @functools.wraps(func)
+    async def wrapper() -> str:
+        task = _inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            _inflight[key] = task
+            task.add_done_callback(lambda _: _inflight.pop(key, None))
+        # Shield so one caller being cancelled does not cancel the shared run
+        return await asyncio.shield(task)
     
-    else:
-        raise ValueError(f"Unknown tool: {name}")
+    return wrapper
+
 
+def _list_dir_names(path: str) -> list[str]:
+    """Return entry names of a directory in one scandir pass (runs off the event loop)"""
+    with os.scandir(path) as entries:
+        return [entry.name for entry in entries]
 
-async def check_deployment_status() -> list[TextContent]:
+
+@tool_handler()
+@single_flight
+async def check_deployment_status() -> str:
     """Check if configuration package is ready"""
-    if DEPLOY_PACKAGE_DIR.exists():
-        files = list(DEPLOY_PACKAGE_DIR.glob("*"))
-        file_list = "\n".join([f"  - {f.name}" for f in files])
+    try:
+        # A single directory read covers both the listing and the required-file check
+        files = await asyncio.to_thread(_list_dir_names, DEPLOY_PACKAGE_DIR_STR)
+    except FileNotFoundError:
+        files = None
+    
+    if files is not None:
+        file_list = "  - " + "\n  - ".join(files) if files else ""
         
         # Check for required files
         required = [
@@ -136,7 +342,8 @@ async def check_deployment_status() -> list[TextContent]:
             "DEPLOYMENT_GUIDE.md"
         ]
         
-        missing = [f for f in required if not (DEPLOY_PACKAGE_DIR / f).exists()]
+        present = set(files)
+        missing = [f for f in required if f not in present]
         
         if missing:
             status = "⚠️  Package incomplete"
@@ -145,255 +352,338 @@ async def check_deployment_status() -> list[TextContent]:
             status = "✅ Package ready for deployment"
             details = f"Found {len(files)} files"
         
-        return [TextContent(
-            type="text",
-            text=f"""
-{status}
-{details}
-
-Package location: {DEPLOY_PACKAGE_DIR}
+        return PACKAGE_STATUS_TEMPLATE.format_map({
+            "status": status,
+            "details": details,
+            "package_dir": DEPLOY_PACKAGE_DIR,
+            "file_list": file_list,
+        })
+    else:
+        return PACKAGE_MISSING_TEMPLATE.format_map({"package_dir": DEPLOY_PACKAGE_DIR})
 
-Files in package:
-{file_list}
 
-Ready to deploy to OpenAI GPT Builder.
-            """
-        )]
-    else:
-        return [TextContent(
-            type="text",
-            text=f"""
-❌ No deployment package found
+async def _read_tail(stream: asyncio.StreamReader, max_lines: int) -> bytes:
+    """Consume a subprocess stream line by line, returning only its last lines"""
+    tail: deque[bytes] = deque(maxlen=max_lines)
+    async for line in stream:
+        tail.append(line)
+    return b"".join(tail)
 
-Package directory does not exist: {DEPLOY_PACKAGE_DIR}
 
-Please run 'generate_gpt_config' first or wait for GitHub Actions to complete.
-            """
-        )]
+def _decode_output(output: bytes) -> str:
+    """Decode captured subprocess output once, at formatting time"""
+    return output.decode("utf-8", errors="replace")
 
 
-async def generate_gpt_config(auto_approve: bool = True) -> list[TextContent]:
+@tool_handler(auto_approve=True)
+async def generate_gpt_config(auto_approve: bool = True) -> str:
     """Generate GPT configuration"""
-    script_path = REPO_ROOT / "autoconfig_gpt.py"
+    global _upload_presence_cache
+    script_path = os.path.join(REPO_ROOT_STR, "autoconfig_gpt.py")
     
-    if not script_path.exists():
-        return [TextContent(
-            type="text",
-            text=f"❌ Error: autoconfig_gpt.py not found at {script_path}"
-        )]
+    if not os.path.lexists(script_path):
+        return f"❌ Error: autoconfig_gpt.py not found at {script_path}"
     
     try:
-        # Run autoconfig script
-        if auto_approve:
-            # Auto-approve by piping "yes" to the script
-            process = subprocess.Popen(
-                ["python", str(script_path)],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=str(REPO_ROOT),
-                text=True
-            )
-            stdout, stderr = process.communicate(input="yes\n")
-        else:
-            # Interactive mode
-            process = subprocess.run(
-                ["python", str(script_path)],
-                cwd=str(REPO_ROOT),
-                capture_output=True,
-                text=True
+        # Run autoconfig script without blocking the server's event loop
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, script_path,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=REPO_ROOT_STR,
+            limit=SUBPROCESS_LINE_LIMIT
+        )
+        try:
+            # Auto-approve by piping "yes" to the script; otherwise just close stdin
+            try:
+                if auto_approve:
+                    process.stdin.write(b"yes\n")
+                    await process.stdin.drain()
+                process.stdin.close()
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # Script exited without reading stdin
+
+            # Drain both pipes concurrently, keeping only the tail of each
+            stdout, stderr = await asyncio.gather(
+                _read_tail(process.stdout, OUTPUT_TAIL_LINES),
+                _read_tail(process.stderr, OUTPUT_TAIL_LINES)
             )
-            stdout = process.stdout
-            stderr = process.stderr
-        
-        if process.returncode == 0 or (hasattr(process, 'returncode') and process.returncode == 0):
-            return [TextContent(
-                type="text",
-                text=f"""
-✅ GPT configuration generated successfully!
+            await process.wait()
+
+            if process.returncode == 0:
+                # Regeneration may have changed the files; drop the presence snapshot
+                _upload_presence_cache = None
+                return GENERATE_SUCCESS_TEMPLATE.format_map({
+                    "stdout": _decode_output(stdout),
+                    "package_dir": DEPLOY_PACKAGE_DIR,
+                })
+            else:
+                return GENERATE_FAILURE_TEMPLATE.format_map({
+                    "returncode": process.returncode,
+                    "stderr": _decode_output(stderr),
+                    "stdout": _decode_output(stdout),
+                })
+        finally:
+            # Don't leave the child running if reading its output failed
+            if process.returncode is None:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass  # Exited before it could be killed
+                await process.wait()
+    
+    except Exception as e:
+        return f"❌ Exception: {str(e)}"
 
-Output:
-{stdout}
 
-Package created at: {DEPLOY_PACKAGE_DIR}
+def _read_text_or_none(path: str) -> Optional[str]:
+    """Read a text file, returning None if it does not exist (runs off the event loop)"""
+    try:
+        with open(path) as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
 
-Next step: Use Computer Use to deploy to OpenAI GPT Builder.
-                """
-            )]
-        else:
-            return [TextContent(
-                type="text",
-                text=f"""
-❌ Error generating configuration
 
-Exit code: {process.returncode}
+# Extracted prompt section per doc path: (st_mtime_ns, section or None)
+_prompt_section_cache: dict[str, tuple[int, Optional[str]]] = {}
 
-Error output:
-{stderr}
 
-Output:
-{stdout}
-                """
-            )]
+def _load_prompt_section(doc_path: str) -> Optional[str]:
+    """Extract the comprehensive prompt section from the docs, cached on mtime (runs off the event loop)"""
+    try:
+        mtime_ns = os.stat(doc_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
     
-    except Exception as e:
-        return [TextContent(
-            type="text",
-            text=f"❌ Exception: {str(e)}"
-        )]
+    cached = _prompt_section_cache.get(doc_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    content = _read_text_or_none(doc_path)
+    match = PROMPT_SECTION_RE.search(content) if content is not None else None
+    prompt_section = match.group(0) if match else None
+    _prompt_section_cache[doc_path] = (mtime_ns, prompt_section)
+    return prompt_section
 
 
-async def get_deployment_guide() -> list[TextContent]:
+@tool_handler()
+@single_flight
+async def get_deployment_guide() -> str:
     """Get deployment guide"""
-    guide_path = DEPLOY_PACKAGE_DIR / "DEPLOYMENT_GUIDE.md"
+    guide_path = os.path.join(DEPLOY_PACKAGE_DIR_STR, "DEPLOYMENT_GUIDE.md")
+    content = await asyncio.to_thread(_read_text_or_none, guide_path)
     
-    if guide_path.exists():
-        content = guide_path.read_text()
-        return [TextContent(
-            type="text",
-            text=f"""
-📄 Deployment Guide
-
-{content}
-            """
-        )]
+    if content is not None:
+        return f"\n📄 Deployment Guide\n\n{content}\n"
     else:
         # Return the comprehensive prompt from documentation
-        doc_path = REPO_ROOT / "CLAUDE_COMPUTER_USE_AUTOMATION.md"
-        if doc_path.exists():
-            content = doc_path.read_text()
-            # Extract the comprehensive prompt section
-            if "Comprehensive Prompt Template" in content:
-                start = content.find("Comprehensive Prompt Template")
-                end = content.find("---", start + 100)
-                if end > start:
-                    prompt_section = content[start:end]
-                    return [TextContent(
-                        type="text",
-                        text=f"📄 Deployment Instructions\n\n{prompt_section}"
-                    )]
+        doc_path = os.path.join(REPO_ROOT_STR, "CLAUDE_COMPUTER_USE_AUTOMATION.md")
+        prompt_section = await asyncio.to_thread(_load_prompt_section, doc_path)
+        if prompt_section is not None:
+            return f"📄 Deployment Instructions\n\n{prompt_section}"
         
-        return [TextContent(
-            type="text",
-            text="❌ Deployment guide not found. Run 'generate_gpt_config' first."
-        )]
+        return "❌ Deployment guide not found. Run 'generate_gpt_config' first."
 
 
-async def get_github_actions_status() -> list[TextContent]:
-    """Check GitHub Actions status"""
-    # This would require GitHub API access
-    # For now, just check if package exists
-    return await check_deployment_status()
+# Shared GitHub API client, created on first use and closed by main()
+_http_client: Optional[httpx.AsyncClient] = None
 
+# Last workflow run summary or error: (time.monotonic() when it expires, text)
+_github_status_cache: Optional[tuple[float, str]] = None
 
-async def list_files_to_upload() -> list[TextContent]:
-    """List files in upload order"""
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get or create the keep-alive GitHub API client"""
+    global _http_client
+    if _http_client is None:
+        headers = {"Accept": "application/vnd.github+json"}
+        token = os.environ.get("GITHUB_TOKEN")
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        _http_client = httpx.AsyncClient(headers=headers, timeout=GITHUB_API_TIMEOUT_SECONDS)
+    return _http_client
+
+
+@functools.cache
+def _github_repository() -> Optional[str]:
+    """Resolve "owner/repo" for the status query, or None if it cannot be determined"""
+    repository = os.environ.get("GITHUB_REPOSITORY")
+    if repository:
+        return repository
+    try:
+        result = subprocess.run(
+            ["git", "config", "--get", "remote.origin.url"],
+            cwd=REPO_ROOT_STR, capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = GITHUB_REMOTE_RE.search(result.stdout.strip())
+    return match.group(1) if match else None
+
+
+async def _fetch_latest_workflow_run(repository: str) -> str:
+    """Summarize the most recent run of the GPT configuration workflow"""
+    url = (
+        f"https://api.github.com/repos/{repository}"
+        f"/actions/workflows/{GITHUB_WORKFLOW_FILE}/runs"
+    )
+    response = await _get_http_client().get(url, params={"per_page": 1})
+    response.raise_for_status()
+    runs = response.json().get("workflow_runs") or []
     
-    upload_sequence = {
-        "Phase 1 - Master Knowledge Base [CRITICAL]": [
-            "BMC_Base_Conocimiento_GPT-2.json",
-            "bromyros_pricing_master.json",
-            "accessories_catalog.json",
-            "bom_rules.json"
-        ],
-        "Phase 2 - Optimized Lookups [CRITICAL]": [
-            "bromyros_pricing_gpt_optimized.json",
-            "shopify_catalog_v1.json",
-            "shopify_catalog_index_v1.csv"
-        ],
-        "Phase 3 - Validation": [
-            "BMC_Base_Unificada_v4.json",
-            "panelin_truth_bmcuruguay_web_only_v2.json"
-        ],
-        "Phase 4 - Documentation": [
-            "Aleros -2.rtf",
-            "panelin_context_consolidacion_sin_backend.md",
-            "PANELIN_KNOWLEDGE_BASE_GUIDE.md",
-            "PANELIN_QUOTATION_PROCESS.md",
-            "PANELIN_TRAINING_GUIDE.md",
-            "GPT_INSTRUCTIONS_PRICING.md",
-            "GPT_PDF_INSTRUCTIONS.md",
-            "GPT_OPTIMIZATION_ANALYSIS.md",
-            "README.md"
-        ],
-        "Phase 5 - Supporting Files": [
-            "Instrucciones GPT.rtf",
-            "Panelin_GPT_config.json"
-        ],
-        "Phase 6 - Assets": [
-            "bmc_logo.png"
-        ]
-    }
+    if not runs:
+        return f"ℹ️  No runs found for {GITHUB_WORKFLOW_FILE} in {repository}\n"
     
-    output = ["📂 File Upload Sequence", ""]
+    run = runs[0]
+    return GITHUB_RUN_TEMPLATE.format_map({
+        "workflow": run.get("name") or GITHUB_WORKFLOW_FILE,
+        "status": run.get("status", "unknown"),
+        "conclusion": run.get("conclusion") or "pending",
+        "branch": run.get("head_branch", "N/A"),
+        "updated_at": run.get("updated_at", "N/A"),
+        "url": run.get("html_url", "N/A"),
+    })
+
+
+@tool_handler()
+async def get_github_actions_status() -> str:
+    """Check GitHub Actions status"""
+    global _github_status_cache
     
-    for phase, files in upload_sequence.items():
-        output.append(f"\n{phase}")
-        output.append(f"Files: {len(files)}")
-        for f in files:
-            exists = (REPO_ROOT / f).exists()
-            status = "✅" if exists else "❌"
-            output.append(f"  {status} {f}")
-        
-        # Add pause instructions
-        if "Phase 1" in phase:
-            output.append("\n⏱️  PAUSE 2-3 MINUTES after uploading Phase 1")
-        elif "Phase 6" not in phase:
-            output.append("\n⏱️  PAUSE 2 MINUTES after uploading this phase")
+    now = time.monotonic()
+    if _github_status_cache is not None and now < _github_status_cache[0]:
+        run_summary = _github_status_cache[1]
+    else:
+        repository = await asyncio.to_thread(_github_repository)
+        try:
+            if repository is None:
+                run_summary = (
+                    "ℹ️  GitHub repository not configured: set GITHUB_REPOSITORY "
+                    "or add a GitHub origin remote\n"
+                )
+            else:
+                run_summary = await _fetch_latest_workflow_run(repository)
+            ttl = GITHUB_STATUS_TTL_SECONDS
+        except (httpx.HTTPError, ValueError) as e:
+            run_summary = f"⚠️  Could not query GitHub Actions: {e}\n"
+            ttl = GITHUB_ERROR_TTL_SECONDS
+        _github_status_cache = (now + ttl, run_summary)
     
-    return [TextContent(
-        type="text",
-        text="\n".join(output)
-    )]
+    # Always report the local package as well, since that is what gets deployed
+    return run_summary + await check_deployment_status()
 
 
-async def get_openai_config() -> list[TextContent]:
-    """Get OpenAI configuration"""
-    config_path = DEPLOY_PACKAGE_DIR / "openai_gpt_config.json"
+# Recent snapshot of which upload files exist: (time.monotonic() when taken, names)
+_upload_presence_cache: Optional[tuple[float, frozenset[str]]] = None
+
+
+def _scan_upload_presence() -> frozenset[str]:
+    """Find which upload files exist with one directory read instead of a stat() per file"""
+    with os.scandir(REPO_ROOT_STR) as entries:
+        return frozenset(entry.name for entry in entries if entry.name in UPLOAD_FILES)
+
+
+@tool_handler()
+@single_flight
+async def list_files_to_upload() -> str:
+    """List files in upload order"""
+    global _upload_presence_cache
     
-    if config_path.exists():
-        content = config_path.read_text()
-        config = json.loads(content)
-        
-        return [TextContent(
-            type="text",
-            text=f"""
-📋 OpenAI GPT Configuration
+    now = time.monotonic()
+    if _upload_presence_cache is not None and now - _upload_presence_cache[0] < UPLOAD_PRESENCE_TTL_SECONDS:
+        present = _upload_presence_cache[1]
+    else:
+        present = await asyncio.to_thread(_scan_upload_presence)
+        _upload_presence_cache = (now, present)
+    
+    statuses = ("✅" if f in present else "❌" for f in UPLOAD_FILES_IN_ORDER)
+    
+    return UPLOAD_LISTING_TEMPLATE.format(*statuses)
 
-Name: {config.get('name', 'N/A')}
 
-Description:
-{config.get('description', 'N/A')}
+def _json_loads(content: str) -> Any:
+    """Parse JSON with orjson when available"""
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
 
-Capabilities:
-{json.dumps(config.get('capabilities', {}), indent=2)}
 
-Conversation Starters:
-{json.dumps(config.get('conversation_starters', []), indent=2)}
+def _json_dumps_pretty(value: Any) -> str:
+    """Serialize JSON with 2-space indentation, keeping non-ASCII text readable"""
+    if HAS_ORJSON:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(value, indent=2, ensure_ascii=False)
 
-Instructions: (see full JSON below)
 
-Full Configuration:
-```json
-{json.dumps(config, indent=2)}
-```
-            """
-        )]
+def _dump_config_sections(config: Any) -> tuple[dict[str, str], str]:
+    """
+    Serialize each top-level config value once and assemble the full document
+    from those pieces; the result matches _json_dumps_pretty(config).
+    """
+    if not isinstance(config, dict) or not config:
+        return {}, _json_dumps_pretty(config)
+    
+    sections = {key: _json_dumps_pretty(value) for key, value in config.items()}
+    # JSON strings never contain raw newlines, so re-indenting nested lines is safe
+    members = []
+    for key, dumped in sections.items():
+        nested = dumped.replace("\n", "\n  ")
+        members.append(f"  {_json_dumps_pretty(key)}: {nested}")
+    return sections, "{\n" + ",\n".join(members) + "\n}"
+
+
+# Formatted get_openai_config output per config path: (st_mtime_ns, text)
+_config_cache: dict[str, tuple[int, str]] = {}
+
+
+@tool_handler()
+@single_flight
+async def get_openai_config() -> str:
+    """Get OpenAI configuration"""
+    config_path = os.path.join(DEPLOY_PACKAGE_DIR_STR, "openai_gpt_config.json")
+    
+    content = None
+    try:
+        mtime_ns = (await asyncio.to_thread(os.stat, config_path)).st_mtime_ns
+    except FileNotFoundError:
+        pass
     else:
-        return [TextContent(
-            type="text",
-            text="❌ Configuration not found. Run 'generate_gpt_config' first."
-        )]
+        cached = _config_cache.get(config_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        content = await asyncio.to_thread(_read_text_or_none, config_path)
+    
+    if content is not None:
+        config = _json_loads(content)
+        sections, full_json = _dump_config_sections(config)
+        
+        text = OPENAI_CONFIG_TEMPLATE.format_map({
+            "name": config.get("name", "N/A"),
+            "description": config.get("description", "N/A"),
+            "capabilities": sections.get("capabilities", "{}"),
+            "conversation_starters": sections.get("conversation_starters", "[]"),
+            "full_json": full_json,
+        })
+        _config_cache[config_path] = (mtime_ns, text)
+        return text
+    else:
+        return "❌ Configuration not found. Run 'generate_gpt_config' first."
 
 
 async def main():
     """Main entry point"""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
+    finally:
+        if _http_client is not None:
+            await _http_client.aclose()
 
 
 if __name__ == "__main__":
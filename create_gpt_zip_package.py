@@ -5,340 +5,567 @@ Creates a comprehensive downloadable ZIP file with all GPT configuration files,
 knowledge bases, schemas, instructions, and documentation.
 """
 
+import functools
+import importlib
 import json
 import os
+import struct
 import sys
+import time
 import zipfile
+import zlib
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Any, Mapping, Optional, Tuple
 from datetime import datetime
 import hashlib
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Buffer size for writing the archive (1 MiB)
+ZIP_BUFFER_SIZE = 1024 * 1024
+
+# Default deflate level: close to level 6's ratio on JSON/Markdown at about
+# twice the speed
+DEFAULT_COMPRESSLEVEL = 3
+
+# ZipFile internals used to append pre-compressed members; without any of
+# them members are written through ZipFile.writestr() instead
+RAW_WRITE_ATTRS = ('_writecheck', '_didModify', 'fp', 'start_dir')
+
+# Already-compressed formats are stored as-is
+STORED_SUFFIXES = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.zip', '.gz'})
+
+# Records the last archive written to output_dir and the source file stamps
+# of its members, so unchanged members can be copied without recompressing
+ZIP_CACHE_FILENAME = ".zip_cache.json"
+
+# All files that should be included in the ZIP package, organized by category
+REQUIRED_FILES = MappingProxyType({
+    "Phase_1_Master_KB": (
+        "BMC_Base_Conocimiento_GPT-2.json",
+        "bromyros_pricing_master.json",
+        "accessories_catalog.json",
+        "bom_rules.json",
+    ),
+    "Phase_2_Optimized_Lookups": (
+        "bromyros_pricing_gpt_optimized.json",
+        "shopify_catalog_v1.json",
+        "shopify_catalog_index_v1.csv",
+    ),
+    "Phase_3_Validation": (
+        "BMC_Base_Unificada_v4.json",
+        "panelin_truth_bmcuruguay_web_only_v2.json",
+    ),
+    "Phase_4_Documentation": (
+        "Aleros -2.rtf",
+        "panelin_context_consolidacion_sin_backend.md",
+        "PANELIN_KNOWLEDGE_BASE_GUIDE.md",
+        "PANELIN_QUOTATION_PROCESS.md",
+        "PANELIN_TRAINING_GUIDE.md",
+        "GPT_INSTRUCTIONS_PRICING.md",
+        "GPT_PDF_INSTRUCTIONS.md",
+        "GPT_OPTIMIZATION_ANALYSIS.md",
+        "README.md",
+    ),
+    "Phase_5_Supporting": (
+        "Instrucciones GPT.rtf",
+        "Panelin_GPT_config.json",
+        "Esquema json.rtf",  # Note: Filename contains space (part of original repo structure)
+    ),
+    "Phase_6_Assets": (
+        "bmc_logo.png",
+    ),
+    "Configuration_Files": (
+        "GPT_AUTOCONFIG_GUIDE.md",
+        "GPT_AUTOCONFIG_FAQ.md",
+        "AUTOCONFIG_QUICK_START.md",
+        "GPT_UPLOAD_CHECKLIST.md",
+        "QUICK_START_GPT_UPLOAD.md",
+    ),
+    "Deployment_Guides": (
+        "DEPLOYMENT_CONFIG.md",
+        "DEPLOYMENT_QUICK_REFERENCE.md",
+        "DEPLOYMENT_CHECKLIST.md",
+        "DEPLOYMENT_DOCS_INDEX.md",
+    ),
+})
+
+# README.txt layout, built once; generate_readme() only fills in the fields,
+# the per-file manifest block and the (optional) missing-files block
+README_TEMPLATE = "\n".join([
+    "=" * 80,
+    "PANELIN GPT CONFIGURATION PACKAGE",
+    "Complete Deployment Package for OpenAI Custom GPT",
+    "=" * 80,
+    "",
+    "Generated: {generated}",
+    "Total Files: {total_files}",
+    "Total Size: {total_size}",
+    "",
+    "=" * 80,
+    "CONTENTS",
+    "=" * 80,
+    "",
+    "This package contains everything needed to deploy the Panelin GPT:",
+    "",
+    "1. Knowledge Base Files (21 files across 6 phases)",
+    "   - Master KB, pricing data, catalogs, BOM rules",
+    "   - Optimized lookup tables and indexes",
+    "   - Validation and reference data",
+    "   - Documentation and guides",
+    "   - Supporting files and assets",
+    "",
+    "2. Configuration Files",
+    "   - GPT_Deploy_Package/gpt_deployment_config.json",
+    "   - GPT_Deploy_Package/openai_gpt_config.json",
+    "   - GPT_Deploy_Package/validation_report.json",
+    "",
+    "3. Deployment Instructions",
+    "   - GPT_Deploy_Package/DEPLOYMENT_GUIDE.md (comprehensive)",
+    "   - GPT_Deploy_Package/QUICK_REFERENCE.txt (one-page)",
+    "   - Configuration and setup guides",
+    "",
+    "=" * 80,
+    "QUICK START",
+    "=" * 80,
+    "",
+    "1. Extract this ZIP file to a folder",
+    "",
+    "2. Read 'GPT_Deploy_Package/DEPLOYMENT_GUIDE.md' for full instructions",
+    "",
+    "3. Go to OpenAI GPT Builder: https://chat.openai.com/gpts/editor",
+    "",
+    "4. Create a new GPT and configure basic settings:",
+    "   - Name: Panelin - BMC Assistant Pro",
+    "   - Description: Copy from openai_gpt_config.json",
+    "   - Instructions: Copy from openai_gpt_config.json",
+    "",
+    "5. Upload Knowledge Base files in EXACT ORDER:",
+    "",
+    "   PHASE 1 - MASTER KB (CRITICAL - Upload first):",
+    "   - BMC_Base_Conocimiento_GPT-2.json",
+    "   - bromyros_pricing_master.json",
+    "   - accessories_catalog.json",
+    "   - bom_rules.json",
+    "   ⏱️  PAUSE 2-3 MINUTES after Phase 1",
+    "",
+    "   PHASE 2 - OPTIMIZED LOOKUPS:",
+    "   - bromyros_pricing_gpt_optimized.json",
+    "   - shopify_catalog_v1.json",
+    "   - shopify_catalog_index_v1.csv",
+    "   ⏱️  PAUSE 2 MINUTES after Phase 2",
+    "",
+    "   PHASE 3 - VALIDATION:",
+    "   - BMC_Base_Unificada_v4.json",
+    "   - panelin_truth_bmcuruguay_web_only_v2.json",
+    "   ⏱️  PAUSE 2 MINUTES after Phase 3",
+    "",
+    "   PHASE 4 - DOCUMENTATION:",
+    "   - Aleros -2.rtf",
+    "   - panelin_context_consolidacion_sin_backend.md",
+    "   - PANELIN_KNOWLEDGE_BASE_GUIDE.md",
+    "   - PANELIN_QUOTATION_PROCESS.md",
+    "   - PANELIN_TRAINING_GUIDE.md",
+    "   - GPT_INSTRUCTIONS_PRICING.md",
+    "   - GPT_PDF_INSTRUCTIONS.md",
+    "   - GPT_OPTIMIZATION_ANALYSIS.md",
+    "   - README.md",
+    "   ⏱️  PAUSE 2 MINUTES after Phase 4",
+    "",
+    "   PHASE 5 - SUPPORTING:",
+    "   - Instrucciones GPT.rtf",
+    "   - Panelin_GPT_config.json",
+    "   ⏱️  PAUSE 2 MINUTES after Phase 5",
+    "",
+    "   PHASE 6 - ASSETS:",
+    "   - bmc_logo.png",
+    "",
+    "6. Configure capabilities:",
+    "   ✅ Enable: Web Browsing",
+    "   ✅ Enable: DALL·E Image Generation",
+    "   ✅ Enable: Code Interpreter",
+    "",
+    "7. Save and test your GPT",
+    "",
+    "=" * 80,
+    "IMPORTANT NOTES",
+    "=" * 80,
+    "",
+    "⚠️  CRITICAL:",
+    "- Upload files in the exact order specified above",
+    "- Wait 2-3 minutes between Phase 1 and Phase 2 (mandatory)",
+    "- Wait 2 minutes between other phases",
+    "- Do NOT skip phases or reorder files",
+    "",
+    "📋 File Upload Sequence:",
+    "The order is critical for proper GPT knowledge indexing.",
+    "Phase 1 contains core knowledge that other phases reference.",
+    "",
+    "🕒 Estimated Time:",
+    "- Configuration setup: 5 minutes",
+    "- File uploads: 10-15 minutes (including pauses)",
+    "- Testing: 5 minutes",
+    "- Total: 20-25 minutes",
+    "",
+    "=" * 80,
+    "FILE MANIFEST",
+    "=" * 80,
+    "{manifest_block}{missing_block}",
+    "",
+    "=" * 80,
+    "SUPPORT",
+    "=" * 80,
+    "",
+    "Repository: https://github.com/matiasportugau-ui/GPT-PANELIN-V3.3",
+    "Documentation: See included DEPLOYMENT_GUIDE.md",
+    "",
+    "For detailed deployment instructions, troubleshooting, and FAQ:",
+    "- Read GPT_Deploy_Package/DEPLOYMENT_GUIDE.md",
+    "- See GPT_AUTOCONFIG_GUIDE.md for configuration details",
+    "- Check DEPLOYMENT_CHECKLIST.md for step-by-step process",
+    "",
+    "=" * 80,
+])
+
+# README.txt warning block, wrapped around the list of missing files
+README_MISSING_HEADER = "\n" + "\n".join([
+    "",
+    "=" * 80,
+    "⚠️  WARNING: MISSING FILES",
+    "=" * 80,
+    "",
+    "The following files are missing from the package:",
+    "",
+])
+
+README_MISSING_FOOTER = "\n" + "\n".join([
+    "",
+    "The package is incomplete. Please ensure all files are present",
+    "before deploying to OpenAI.",
+    "",
+])
+
+# Units for format_size(), one per power of 1024
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+@dataclass
+class FileValidation:
+    """
+    Required-file validation results as parallel arrays,
+    one slot per (category, filename) in package order
+    """
+    
+    category_names: Tuple[str, ...]
+    names: List[str] = field(default_factory=list)
+    categories: array = field(default_factory=lambda: array('B'))
+    sizes: array = field(default_factory=lambda: array('q'))
+    present: bytearray = field(default_factory=bytearray)
+    sizes_readable: List[str] = field(default_factory=list)
+    blake2b: List[str] = field(default_factory=list)
+    total_size: int = 0
+    total_size_readable: str = ""
+    
+    @property
+    def present_count(self) -> int:
+        return self.present.count(1)
+    
+    @property
+    def missing_count(self) -> int:
+        return self.present.count(0)
+    
+    @property
+    def all_present(self) -> bool:
+        return self.missing_count == 0
+    
+    def iter_files(self) -> Iterator[Tuple[str, str, int, str, str, bool]]:
+        """Yield (name, category, size, size_readable, blake2b, present) for every required file"""
+        category_names = self.category_names
+        for name, category_id, size, size_readable, digest, present in zip(
+            self.names, self.categories, self.sizes, self.sizes_readable, self.blake2b, self.present
+        ):
+            yield name, category_names[category_id], size, size_readable, digest, bool(present)
+    
+    def iter_missing(self) -> Iterator[Tuple[str, str]]:
+        """Yield (name, category) for every missing file"""
+        for name, category, _, _, _, present in self.iter_files():
+            if not present:
+                yield name, category
+
+
+@dataclass
+class PackageEntry:
+    """
+    One required file with everything the README, MANIFEST and ZIP writer need
+    """
+    
+    category: str
+    name: str
+    arcname: str
+    full_path: str
+    present: bool
+    size: int
+    size_readable: str
+    blake2b: str
+    first_in_category: bool
+    
+    def readme_lines(self) -> str:
+        """README.txt file-manifest text for this entry (category heading included)"""
+        heading = f"\n\n{self.category.replace('_', ' ').upper()}:" if self.first_in_category else ""
+        if self.present:
+            return f"{heading}\n  ✅ {self.name} ({self.size_readable})"
+        return f"{heading}\n  ❌ {self.name} (MISSING)"
+    
+    def manifest_record(self) -> Dict[str, Any]:
+        """MANIFEST.json record for this entry (present files only)"""
+        return {
+            "name": self.name,
+            "category": self.category,
+            "size_bytes": self.size,
+            "size_readable": self.size_readable,
+            "blake2b": self.blake2b
+        }
+
+
+@functools.lru_cache(maxsize=4096)
+def format_size(size_bytes: int) -> str:
+    """Format size in human-readable format (memoized; the same sizes recur)"""
+    # Each unit step is 10 bits, so the bit length picks the unit directly
+    exponent = min(max(size_bytes.bit_length() - 1, 0) // 10, len(SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * exponent)):.2f} {SIZE_UNITS[exponent]}"
+
+
+def hash_file(filepath: str) -> str:
+    """Return the BLAKE2b-128 hex digest of a file, read in ZIP_BUFFER_SIZE chunks"""
+    h = hashlib.blake2b(digest_size=16)
+    with open(filepath, 'rb', buffering=0) as f:
+        for chunk in iter(lambda: f.read(ZIP_BUFFER_SIZE), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def dumps_manifest(manifest: Dict[str, Any]) -> bytes:
+    """Serialize the manifest as indented UTF-8 JSON"""
+    if HAS_ORJSON:
+        return orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    return json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def member_compress_type(filepath: str) -> int:
+    """Return the ZIP compression method to use for a file"""
+    if os.path.splitext(filepath)[1].lower() in STORED_SUFFIXES:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def compress_file(filepath: str, compress_type: int, compresslevel: int) -> tuple:
+    """
+    Read a file and compress it with compress_bytes()
+    """
+    
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    return compress_bytes(data, compress_type, compresslevel)
+
+
+def compress_bytes(data: bytes, compress_type: int, compresslevel: int) -> tuple:
+    """
+    Compress data as stored in a ZIP member (a raw deflate stream, or the
+    bytes unchanged for ZIP_STORED).
+    Returns (compressed_bytes, crc32, uncompressed_size).
+    """
+    
+    if compress_type == zipfile.ZIP_STORED:
+        return data, zlib.crc32(data), len(data)
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    return compressed, zlib.crc32(data), len(data)
+
+
+def read_raw_member(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo) -> bytes:
+    """
+    Read a member's compressed bytes from an archive without decompressing them
+    """
+    
+    zipf.fp.seek(zinfo.header_offset)
+    header = zipf.fp.read(zipfile.sizeFileHeader)
+    if header[:4] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad local file header for {zinfo.filename}")
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    zipf.fp.seek(name_length + extra_length, os.SEEK_CUR)
+    return zipf.fp.read(zinfo.compress_size)
+
 
 class GPTZipPackager:
     """
     Creates a complete ZIP package for GPT configuration deployment
     """
     
-    def __init__(self, repo_root: Path):
+    def __init__(self, repo_root: Path, autoconfig_module: Optional[Any] = None,
+                 compresslevel: int = DEFAULT_COMPRESSLEVEL):
         self.repo_root = repo_root
+        self._root_str = os.fspath(repo_root)
+        self.compresslevel = compresslevel
+        self.autoconfig_module = autoconfig_module
+        # Status lines are buffered and written per step when stdout is not
+        # a terminal (pipes, CI logs); interactive runs print immediately
+        self._log_lines: Optional[List[str]] = None if sys.stdout.isatty() else []
         self.output_dir = repo_root / "GPT_Complete_Package"
         self.zip_filename = f"Panelin_GPT_Config_Package_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
         
-    def get_all_required_files(self) -> Dict[str, List[str]]:
+    def _log(self, message: str = "") -> None:
+        """Print a status line, or buffer it until the next _flush_log()"""
+        if self._log_lines is None:
+            print(message)
+        else:
+            self._log_lines.append(message)
+    
+    def _flush_log(self) -> None:
+        """Write all buffered status lines in one call"""
+        if self._log_lines:
+            sys.stdout.write("\n".join(self._log_lines) + "\n")
+            sys.stdout.flush()
+            self._log_lines.clear()
+    
+    def get_all_required_files(self) -> Mapping[str, Tuple[str, ...]]:
         """
-        Define all files that should be included in the ZIP package
+        Return all files that should be included in the ZIP package
         Organized by category
         """
         
-        files_by_category = {
-            "Phase_1_Master_KB": [
-                "BMC_Base_Conocimiento_GPT-2.json",
-                "bromyros_pricing_master.json",
-                "accessories_catalog.json",
-                "bom_rules.json",
-            ],
-            "Phase_2_Optimized_Lookups": [
-                "bromyros_pricing_gpt_optimized.json",
-                "shopify_catalog_v1.json",
-                "shopify_catalog_index_v1.csv",
-            ],
-            "Phase_3_Validation": [
-                "BMC_Base_Unificada_v4.json",
-                "panelin_truth_bmcuruguay_web_only_v2.json",
-            ],
-            "Phase_4_Documentation": [
-                "Aleros -2.rtf",
-                "panelin_context_consolidacion_sin_backend.md",
-                "PANELIN_KNOWLEDGE_BASE_GUIDE.md",
-                "PANELIN_QUOTATION_PROCESS.md",
-                "PANELIN_TRAINING_GUIDE.md",
-                "GPT_INSTRUCTIONS_PRICING.md",
-                "GPT_PDF_INSTRUCTIONS.md",
-                "GPT_OPTIMIZATION_ANALYSIS.md",
-                "README.md",
-            ],
-            "Phase_5_Supporting": [
-                "Instrucciones GPT.rtf",
-                "Panelin_GPT_config.json",
-                "Esquema json.rtf",  # Note: Filename contains space (part of original repo structure)
-            ],
-            "Phase_6_Assets": [
-                "bmc_logo.png",
-            ],
-            "Configuration_Files": [
-                "GPT_AUTOCONFIG_GUIDE.md",
-                "GPT_AUTOCONFIG_FAQ.md",
-                "AUTOCONFIG_QUICK_START.md",
-                "GPT_UPLOAD_CHECKLIST.md",
-                "QUICK_START_GPT_UPLOAD.md",
-            ],
-            "Deployment_Guides": [
-                "DEPLOYMENT_CONFIG.md",
-                "DEPLOYMENT_QUICK_REFERENCE.md",
-                "DEPLOYMENT_CHECKLIST.md",
-                "DEPLOYMENT_DOCS_INDEX.md",
-            ],
-        }
+        return REQUIRED_FILES
+    
+    def _index_repo_root(self) -> Dict[str, os.stat_result]:
+        """
+        Map each regular file directly under repo_root to its stat result
+        """
         
-        return files_by_category
+        with os.scandir(self._root_str) as it:
+            return {entry.name: entry.stat() for entry in it if entry.is_file()}
     
-    def validate_files(self, files_by_category: Dict[str, List[str]]) -> Dict[str, Any]:
+    def validate_files(self, files_by_category: Mapping[str, Tuple[str, ...]]) -> FileValidation:
         """
         Validate that all required files exist
         """
         
-        validation = {
-            "all_present": True,
-            "missing_files": [],
-            "present_files": [],
-            "total_size": 0,
-            "file_details": {},
-        }
+        validation = FileValidation(category_names=tuple(files_by_category))
+        entries = self._index_repo_root()
         
-        for category, files in files_by_category.items():
-            for filename in files:
-                filepath = self.repo_root / filename
-                
-                if filepath.exists():
-                    size = filepath.stat().st_size
-                    validation["present_files"].append({
-                        "name": filename,
-                        "category": category,
-                        "size": size,
-                        "path": str(filepath)
-                    })
-                    validation["total_size"] += size
-                    validation["file_details"][filename] = {
-                        "exists": True,
-                        "size": size,
-                        "category": category
-                    }
-                else:
-                    validation["all_present"] = False
-                    validation["missing_files"].append({
-                        "name": filename,
-                        "category": category
-                    })
-                    validation["file_details"][filename] = {
-                        "exists": False,
-                        "category": category
-                    }
+        # Checksums are computed in parallel (hashlib releases the GIL)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            digests = []
+            for category_id, files in enumerate(files_by_category.values()):
+                for filename in files:
+                    st = entries.get(filename)
+                    size = st.st_size if st is not None else 0
+                    
+                    validation.names.append(filename)
+                    validation.categories.append(category_id)
+                    validation.sizes.append(size)
+                    validation.present.append(st is not None)
+                    validation.sizes_readable.append(self.format_size(size) if st is not None else "")
+                    validation.total_size += size
+                    digests.append(
+                        pool.submit(hash_file, os.path.join(self._root_str, filename))
+                        if st is not None else None
+                    )
+            
+            validation.blake2b = [
+                digest.result() if digest is not None else "" for digest in digests
+            ]
         
+        validation.total_size_readable = self.format_size(validation.total_size)
         return validation
     
     def format_size(self, size_bytes: int) -> str:
         """Format size in human-readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} TB"
+        return format_size(size_bytes)
     
-    def generate_readme(self, validation: Dict[str, Any]) -> str:
+    def _iter_package_entries(self, validation: FileValidation) -> Iterator[PackageEntry]:
+        """
+        Yield a PackageEntry for every required file, in package order
+        """
+        
+        current_category = None
+        for name, category, size, size_readable, digest, present in validation.iter_files():
+            yield PackageEntry(
+                category=category,
+                name=name,
+                arcname=f"{category}/{name}",
+                full_path=os.path.join(self._root_str, name),
+                present=present,
+                size=size,
+                size_readable=size_readable,
+                blake2b=digest,
+                first_in_category=category != current_category,
+            )
+            current_category = category
+    
+    def generate_readme(self, validation: FileValidation,
+                        file_lines: Optional[List[str]] = None) -> str:
         """
         Generate README.txt for the ZIP package
+        file_lines: per-entry manifest text already collected by the caller
         """
         
-        readme_lines = [
-            "=" * 80,
-            "PANELIN GPT CONFIGURATION PACKAGE",
-            "Complete Deployment Package for OpenAI Custom GPT",
-            "=" * 80,
-            "",
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            f"Total Files: {len(validation['present_files'])}",
-            f"Total Size: {self.format_size(validation['total_size'])}",
-            "",
-            "=" * 80,
-            "CONTENTS",
-            "=" * 80,
-            "",
-            "This package contains everything needed to deploy the Panelin GPT:",
-            "",
-            "1. Knowledge Base Files (21 files across 6 phases)",
-            "   - Master KB, pricing data, catalogs, BOM rules",
-            "   - Optimized lookup tables and indexes",
-            "   - Validation and reference data",
-            "   - Documentation and guides",
-            "   - Supporting files and assets",
-            "",
-            "2. Configuration Files",
-            "   - GPT_Deploy_Package/gpt_deployment_config.json",
-            "   - GPT_Deploy_Package/openai_gpt_config.json",
-            "   - GPT_Deploy_Package/validation_report.json",
-            "",
-            "3. Deployment Instructions",
-            "   - GPT_Deploy_Package/DEPLOYMENT_GUIDE.md (comprehensive)",
-            "   - GPT_Deploy_Package/QUICK_REFERENCE.txt (one-page)",
-            "   - Configuration and setup guides",
-            "",
-            "=" * 80,
-            "QUICK START",
-            "=" * 80,
-            "",
-            "1. Extract this ZIP file to a folder",
-            "",
-            "2. Read 'GPT_Deploy_Package/DEPLOYMENT_GUIDE.md' for full instructions",
-            "",
-            "3. Go to OpenAI GPT Builder: https://chat.openai.com/gpts/editor",
-            "",
-            "4. Create a new GPT and configure basic settings:",
-            "   - Name: Panelin - BMC Assistant Pro",
-            "   - Description: Copy from openai_gpt_config.json",
-            "   - Instructions: Copy from openai_gpt_config.json",
-            "",
-            "5. Upload Knowledge Base files in EXACT ORDER:",
-            "",
-            "   PHASE 1 - MASTER KB (CRITICAL - Upload first):",
-            "   - BMC_Base_Conocimiento_GPT-2.json",
-            "   - bromyros_pricing_master.json",
-            "   - accessories_catalog.json",
-            "   - bom_rules.json",
-            "   ⏱️  PAUSE 2-3 MINUTES after Phase 1",
-            "",
-            "   PHASE 2 - OPTIMIZED LOOKUPS:",
-            "   - bromyros_pricing_gpt_optimized.json",
-            "   - shopify_catalog_v1.json",
-            "   - shopify_catalog_index_v1.csv",
-            "   ⏱️  PAUSE 2 MINUTES after Phase 2",
-            "",
-            "   PHASE 3 - VALIDATION:",
-            "   - BMC_Base_Unificada_v4.json",
-            "   - panelin_truth_bmcuruguay_web_only_v2.json",
-            "   ⏱️  PAUSE 2 MINUTES after Phase 3",
-            "",
-            "   PHASE 4 - DOCUMENTATION:",
-            "   - Aleros -2.rtf",
-            "   - panelin_context_consolidacion_sin_backend.md",
-            "   - PANELIN_KNOWLEDGE_BASE_GUIDE.md",
-            "   - PANELIN_QUOTATION_PROCESS.md",
-            "   - PANELIN_TRAINING_GUIDE.md",
-            "   - GPT_INSTRUCTIONS_PRICING.md",
-            "   - GPT_PDF_INSTRUCTIONS.md",
-            "   - GPT_OPTIMIZATION_ANALYSIS.md",
-            "   - README.md",
-            "   ⏱️  PAUSE 2 MINUTES after Phase 4",
-            "",
-            "   PHASE 5 - SUPPORTING:",
-            "   - Instrucciones GPT.rtf",
-            "   - Panelin_GPT_config.json",
-            "   ⏱️  PAUSE 2 MINUTES after Phase 5",
-            "",
-            "   PHASE 6 - ASSETS:",
-            "   - bmc_logo.png",
-            "",
-            "6. Configure capabilities:",
-            "   ✅ Enable: Web Browsing",
-            "   ✅ Enable: DALL·E Image Generation",
-            "   ✅ Enable: Code Interpreter",
-            "",
-            "7. Save and test your GPT",
-            "",
-            "=" * 80,
-            "IMPORTANT NOTES",
-            "=" * 80,
-            "",
-            "⚠️  CRITICAL:",
-            "- Upload files in the exact order specified above",
-            "- Wait 2-3 minutes between Phase 1 and Phase 2 (mandatory)",
-            "- Wait 2 minutes between other phases",
-            "- Do NOT skip phases or reorder files",
-            "",
-            "📋 File Upload Sequence:",
-            "The order is critical for proper GPT knowledge indexing.",
-            "Phase 1 contains core knowledge that other phases reference.",
-            "",
-            "🕒 Estimated Time:",
-            "- Configuration setup: 5 minutes",
-            "- File uploads: 10-15 minutes (including pauses)",
-            "- Testing: 5 minutes",
-            "- Total: 20-25 minutes",
-            "",
-            "=" * 80,
-            "FILE MANIFEST",
-            "=" * 80,
-            "",
-        ]
-        
-        # Add file manifest by category
-        for category, files in self.get_all_required_files().items():
-            readme_lines.append(f"\n{category.replace('_', ' ').upper()}:")
-            for filename in files:
-                file_info = validation["file_details"].get(filename, {})
-                if file_info.get("exists"):
-                    size_str = self.format_size(file_info["size"])
-                    readme_lines.append(f"  ✅ {filename} ({size_str})")
-                else:
-                    readme_lines.append(f"  ❌ {filename} (MISSING)")
-        
-        if validation["missing_files"]:
-            readme_lines.extend([
-                "",
-                "=" * 80,
-                "⚠️  WARNING: MISSING FILES",
-                "=" * 80,
-                "",
-                "The following files are missing from the package:",
-                ""
-            ])
-            for missing in validation["missing_files"]:
-                readme_lines.append(f"  ❌ {missing['name']} (Category: {missing['category']})")
-            readme_lines.extend([
-                "",
-                "The package is incomplete. Please ensure all files are present",
-                "before deploying to OpenAI.",
-                ""
+        if file_lines is None:
+            file_lines = [entry.readme_lines() for entry in self._iter_package_entries(validation)]
+        
+        missing_block = ""
+        if not validation.all_present:
+            missing_block = "".join([
+                README_MISSING_HEADER,
+                *(f"\n  ❌ {filename} (Category: {category})"
+                  for filename, category in validation.iter_missing()),
+                README_MISSING_FOOTER,
             ])
         
-        readme_lines.extend([
-            "",
-            "=" * 80,
-            "SUPPORT",
-            "=" * 80,
-            "",
-            "Repository: https://github.com/matiasportugau-ui/GPT-PANELIN-V3.3",
-            "Documentation: See included DEPLOYMENT_GUIDE.md",
-            "",
-            "For detailed deployment instructions, troubleshooting, and FAQ:",
-            "- Read GPT_Deploy_Package/DEPLOYMENT_GUIDE.md",
-            "- See GPT_AUTOCONFIG_GUIDE.md for configuration details",
-            "- Check DEPLOYMENT_CHECKLIST.md for step-by-step process",
-            "",
-            "=" * 80,
-        ])
-        
-        return "\n".join(readme_lines)
+        return README_TEMPLATE.format(
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            total_files=validation.present_count,
+            total_size=validation.total_size_readable,
+            manifest_block="".join(file_lines),
+            missing_block=missing_block,
+        )
     
-    def generate_manifest(self, validation: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_manifest(self, validation: FileValidation,
+                          files: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Generate manifest file with all package contents
+        files: manifest records already collected by the caller
         """
         
+        if files is None:
+            files = [
+                entry.manifest_record()
+                for entry in self._iter_package_entries(validation)
+                if entry.present
+            ]
+        
         manifest = {
             "package_name": "Panelin GPT Configuration Package",
             "generated_at": datetime.now().isoformat(),
             "version": "3.3",
-            "total_files": len(validation["present_files"]),
-            "total_size_bytes": validation["total_size"],
-            "total_size_readable": self.format_size(validation["total_size"]),
-            "all_files_present": validation["all_present"],
-            "missing_count": len(validation["missing_files"]),
-            "files": []
+            "total_files": validation.present_count,
+            "total_size_bytes": validation.total_size,
+            "total_size_readable": validation.total_size_readable,
+            "all_files_present": validation.all_present,
+            "missing_count": validation.missing_count,
+            "files": files
         }
         
-        for file_info in validation["present_files"]:
-            manifest["files"].append({
-                "name": file_info["name"],
-                "category": file_info["category"],
-                "size_bytes": file_info["size"],
-                "size_readable": self.format_size(file_info["size"])
-            })
-        
-        if validation["missing_files"]:
+        if not validation.all_present:
             manifest["missing_files"] = [
-                {"name": f["name"], "category": f["category"]}
-                for f in validation["missing_files"]
+                {"name": filename, "category": category}
+                for filename, category in validation.iter_missing()
             ]
         
         return manifest
@@ -349,27 +576,32 @@ class GPTZipPackager:
         Returns True if successful, False otherwise
         """
         
-        print("=" * 80)
-        print("STEP 1: Generating GPT Configuration")
-        print("=" * 80)
-        print()
+        self._log("=" * 80)
+        self._log("STEP 1: Generating GPT Configuration")
+        self._log("=" * 80)
+        self._log()
         
         autoconfig_script = self.repo_root / "autoconfig_gpt.py"
         
-        if not autoconfig_script.exists():
-            print(f"❌ Error: {autoconfig_script} not found")
+        if self.autoconfig_module is None and not autoconfig_script.exists():
+            self._log(f"❌ Error: {autoconfig_script} not found")
+            self._flush_log()
             return False
         
-        # Import and run the autoconfig module
-        import importlib.util
-        spec = importlib.util.spec_from_file_location("autoconfig_gpt", autoconfig_script)
-        autoconfig_module = importlib.util.module_from_spec(spec)
+        # The configurator prints its own output
+        self._flush_log()
         
         try:
-            spec.loader.exec_module(autoconfig_module)
+            # Import the autoconfig module through sys.modules so repeated
+            # runs in the same process reuse it
+            if self.autoconfig_module is None:
+                repo_root_str = str(self.repo_root)
+                if repo_root_str not in sys.path:
+                    sys.path.insert(0, repo_root_str)
+                self.autoconfig_module = importlib.import_module("autoconfig_gpt")
             
             # Run the configurator with auto-approval
-            configurator = autoconfig_module.GPTAutoConfigurator(self.repo_root)
+            configurator = self.autoconfig_module.GPTAutoConfigurator(self.repo_root)
             
             # Suppress approval prompt by directly running steps
             base_config = configurator.load_base_config()
@@ -377,154 +609,328 @@ class GPTZipPackager:
             deployment_config = configurator.generate_deployment_config(base_config)
             configurator.save_deployment_package(deployment_config, validation)
             
-            print("✅ GPT configuration generated successfully")
-            print(f"   Output: {self.repo_root / 'GPT_Deploy_Package'}")
-            print()
+            self._log("✅ GPT configuration generated successfully")
+            self._log(f"   Output: {self.repo_root / 'GPT_Deploy_Package'}")
+            self._log()
+            self._flush_log()
             return True
             
         except Exception as e:
-            print(f"❌ Error running autoconfig: {e}")
+            self._log(f"❌ Error running autoconfig: {e}")
+            self._flush_log()
             import traceback
             traceback.print_exc()
             return False
     
-    def create_zip_package(self, validation: Dict[str, Any]) -> Optional[Path]:
+    def _write_compressed_member(self, zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo,
+                                 compressed_member: tuple) -> None:
+        """
+        Write a member whose data was already compressed by compress_bytes().
+        The local header is written once with the final CRC and sizes, so the
+        archive is written strictly forward (no seek back to patch it as
+        ZipFile.write()/writestr() do); entries are otherwise identical.
+        This drives ZipFile's internal write state directly, since the public
+        API cannot take pre-compressed data; the archives are checked with
+        testzip() and `unzip -t` in tests/test_create_gpt_zip_package.py.
+        If a Python version lacks those internals (RAW_WRITE_ATTRS), the data
+        is decompressed and written with writestr() instead.
+        """
+        
+        compressed, crc, file_size = compressed_member
+        if not all(hasattr(zipf, name) for name in RAW_WRITE_ATTRS):
+            data = compressed
+            if zinfo.compress_type != zipfile.ZIP_STORED:
+                data = zlib.decompress(compressed, -15)
+            zipf.writestr(zinfo, data, compresslevel=self.compresslevel)
+            return
+        zinfo.flag_bits = 0x00
+        zinfo.CRC = crc
+        zinfo.file_size = file_size
+        zinfo.compress_size = len(compressed)
+        zip64 = zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+        
+        # Members are only ever appended, so the file position is start_dir
+        zinfo.header_offset = zipf.start_dir
+        zipf._writecheck(zinfo)
+        zipf._didModify = True
+        zipf.fp.write(zinfo.FileHeader(zip64))
+        zipf.fp.write(compressed)
+        zipf.start_dir = zipf.fp.tell()
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+    
+    def _write_file_member(self, zipf: zipfile.ZipFile, filepath: str, arcname: str,
+                           compressed_member: tuple) -> None:
+        """
+        Write a file member compressed by compress_file(), with the file's
+        timestamp and permissions
+        """
+        
+        zinfo = zipfile.ZipInfo.from_file(filepath, arcname)
+        zinfo.compress_type = member_compress_type(filepath)
+        self._write_compressed_member(zipf, zinfo, compressed_member)
+    
+    def _write_text_member(self, zipf: zipfile.ZipFile, arcname: str, data: bytes) -> None:
+        """
+        Write generated content, with the same metadata ZipFile.writestr() uses
+        """
+        
+        zinfo = zipfile.ZipInfo(filename=arcname, date_time=time.localtime(time.time())[:6])
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.external_attr = 0o600 << 16
+        self._write_compressed_member(
+            zipf, zinfo, compress_bytes(data, zipfile.ZIP_DEFLATED, self.compresslevel)
+        )
+    
+    def _load_zip_cache(self) -> Dict[str, Any]:
+        """
+        Load the member cache left by the previous run, if any
+        """
+        
+        try:
+            with open(self.output_dir / ZIP_CACHE_FILENAME, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _open_previous_zip(self, cache: Dict[str, Any]) -> Optional[zipfile.ZipFile]:
+        """
+        Open the archive described by the cache, unless it is missing or is
+        about to be overwritten by this run
+        """
+        
+        previous_name = cache.get("zip_filename")
+        if not previous_name or previous_name == self.zip_filename:
+            return None
+        try:
+            return zipfile.ZipFile(self.output_dir / previous_name)
+        except (OSError, zipfile.BadZipFile):
+            return None
+    
+    def _reuse_member(self, previous_zip: Optional[zipfile.ZipFile],
+                      cached_files: Dict[str, Any], arcname: str,
+                      stamp: List[Any], compress_type: int) -> Optional[tuple]:
+        """
+        Return (compressed_bytes, crc32, size) copied from the previous archive
+        when the source file is unchanged, otherwise None
+        """
+        
+        if previous_zip is None or cached_files.get(arcname) != stamp:
+            return None
+        try:
+            zinfo = previous_zip.getinfo(arcname)
+        except KeyError:
+            return None
+        if zinfo.compress_type != compress_type or zinfo.file_size != stamp[2]:
+            return None
+        return read_raw_member(previous_zip, zinfo), zinfo.CRC, zinfo.file_size
+    
+    def create_zip_package(self, validation: FileValidation) -> Optional[Path]:
         """
         Create the ZIP package with all files
         """
         
-        print("=" * 80)
-        print("STEP 2: Creating ZIP Package")
-        print("=" * 80)
-        print()
+        self._log("=" * 80)
+        self._log("STEP 2: Creating ZIP Package")
+        self._log("=" * 80)
+        self._log()
         
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         zip_path = self.output_dir / self.zip_filename
+        cache = self._load_zip_cache()
+        cached_files = {}
+        if cache.get("compresslevel") == self.compresslevel:
+            cached_files = cache.get("files", {})
+        previous_zip = self._open_previous_zip(cache)
         
         try:
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                
-                # Add README
-                print("📝 Adding README.txt...")
-                readme_content = self.generate_readme(validation)
-                zipf.writestr("README.txt", readme_content)
+            with open(zip_path, 'wb', buffering=ZIP_BUFFER_SIZE) as zip_file, \
+                    zipfile.ZipFile(zip_file, 'w', zipfile.ZIP_DEFLATED, allowZip64=True,
+                                    compresslevel=self.compresslevel) as zipf:
                 
-                # Add manifest
-                print("📝 Adding MANIFEST.json...")
-                manifest = self.generate_manifest(validation)
-                zipf.writestr("MANIFEST.json", json.dumps(manifest, indent=2, ensure_ascii=False))
+                deploy_pkg_dir = os.path.join(self._root_str, "GPT_Deploy_Package")
+                deploy_pkg_exists = os.path.exists(deploy_pkg_dir)
+                # (name, path, stat result) for each file in GPT_Deploy_Package
+                deploy_files = []
+                if deploy_pkg_exists:
+                    with os.scandir(deploy_pkg_dir) as it:
+                        deploy_files = [
+                            (entry.name, entry.path, entry.stat())
+                            for entry in it if entry.is_file()
+                        ]
                 
-                # Add all knowledge base files by category
-                files_by_category = self.get_all_required_files()
+                # Walk the package entries once: collect the README and
+                # MANIFEST file listings and queue each member for
+                # compression (in parallel, zlib releases the GIL), reusing
+                # unchanged members from the previous archive
+                readme_lines = []
+                manifest_files = []
+                # Log lines and (arcname, full path, display name) members, in archive order
+                steps = []
+                stamps = {}
+                compressed = {}
                 
-                for category, files in files_by_category.items():
-                    print(f"\n📦 Adding {category.replace('_', ' ')} files...")
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                    def queue_member(arcname: str, full_path: str,
+                                     st: Optional[os.stat_result] = None) -> None:
+                        if st is None:
+                            st = os.stat(full_path)
+                        stamps[arcname] = [full_path, st.st_mtime_ns, st.st_size]
+                        compress_type = member_compress_type(full_path)
+                        reused = self._reuse_member(
+                            previous_zip, cached_files, arcname, stamps[arcname], compress_type
+                        )
+                        if reused is not None:
+                            compressed[arcname] = Future()
+                            compressed[arcname].set_result(reused)
+                        else:
+                            compressed[arcname] = pool.submit(
+                                compress_file, full_path, compress_type, self.compresslevel
+                            )
                     
-                    for filename in files:
-                        filepath = self.repo_root / filename
+                    # Add all knowledge base files by category
+                    for entry in self._iter_package_entries(validation):
+                        readme_lines.append(entry.readme_lines())
+                        if entry.first_in_category:
+                            steps.append(f"\n📦 Adding {entry.category.replace('_', ' ')} files...")
                         
-                        if filepath.exists():
+                        if entry.present:
+                            manifest_files.append(entry.manifest_record())
                             # Organize files in category folders within ZIP
-                            arcname = f"{category}/{filename}"
-                            zipf.write(filepath, arcname)
-                            print(f"   ✅ {filename}")
+                            queue_member(entry.arcname, entry.full_path)
+                            steps.append((entry.arcname, entry.full_path, entry.name))
                         else:
-                            print(f"   ⚠️  Skipped (not found): {filename}")
-                
-                # Add GPT_Deploy_Package directory if it exists
-                deploy_pkg_dir = self.repo_root / "GPT_Deploy_Package"
-                if deploy_pkg_dir.exists():
-                    print("\n📦 Adding GPT_Deploy_Package files...")
-                    for file in deploy_pkg_dir.iterdir():
-                        if file.is_file():
-                            arcname = f"GPT_Deploy_Package/{file.name}"
-                            zipf.write(file, arcname)
-                            print(f"   ✅ {file.name}")
+                            steps.append(f"   ⚠️  Skipped (not found): {entry.name}")
+                    
+                    # Add GPT_Deploy_Package directory if it exists
+                    if deploy_pkg_exists:
+                        steps.append("\n📦 Adding GPT_Deploy_Package files...")
+                        for name, full_path, st in deploy_files:
+                            arcname = f"GPT_Deploy_Package/{name}"
+                            queue_member(arcname, full_path, st)
+                            steps.append((arcname, full_path, name))
+                    
+                    # Add README
+                    self._log("📝 Adding README.txt...")
+                    readme_content = self.generate_readme(validation, readme_lines)
+                    self._write_text_member(zipf, "README.txt", readme_content.encode('utf-8'))
+                    
+                    # Add manifest
+                    self._log("📝 Adding MANIFEST.json...")
+                    manifest = self.generate_manifest(validation, manifest_files)
+                    self._write_text_member(zipf, "MANIFEST.json", dumps_manifest(manifest))
+                    
+                    for step in steps:
+                        if isinstance(step, str):
+                            self._log(step)
+                            continue
+                        arcname, full_path, name = step
+                        self._write_file_member(
+                            zipf, full_path, arcname, compressed[arcname].result()
+                        )
+                        self._log(f"   ✅ {name}")
                 
-                print()
+                self._log()
+            
+            with open(self.output_dir / ZIP_CACHE_FILENAME, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "zip_filename": self.zip_filename,
+                    "compresslevel": self.compresslevel,
+                    "files": stamps,
+                }, f)
             
+            self._flush_log()
             return zip_path
             
         except Exception as e:
-            print(f"❌ Error creating ZIP: {e}")
+            self._log(f"❌ Error creating ZIP: {e}")
+            self._flush_log()
             import traceback
             traceback.print_exc()
             return None
+        
+        finally:
+            if previous_zip is not None:
+                previous_zip.close()
     
     def run(self) -> int:
         """
         Run the complete ZIP package generation process
         """
         
-        print()
-        print("=" * 80)
-        print("GPT CONFIGURATION ZIP PACKAGE GENERATOR")
-        print("Panelin - BMC Assistant Pro")
-        print("=" * 80)
-        print()
+        self._log()
+        self._log("=" * 80)
+        self._log("GPT CONFIGURATION ZIP PACKAGE GENERATOR")
+        self._log("Panelin - BMC Assistant Pro")
+        self._log("=" * 80)
+        self._log()
         
         try:
             # Step 1: Run autoconfig to generate deployment package
             if not self.run_autoconfig():
-                print("\n⚠️  Warning: Autoconfig failed, continuing with available files...")
+                self._log("\n⚠️  Warning: Autoconfig failed, continuing with available files...")
             
             # Step 2: Validate all required files
             files_by_category = self.get_all_required_files()
             validation = self.validate_files(files_by_category)
             
-            print("=" * 80)
-            print("File Validation")
-            print("=" * 80)
-            print(f"✅ Found: {len(validation['present_files'])} files")
-            print(f"📦 Total size: {self.format_size(validation['total_size'])}")
+            self._log("=" * 80)
+            self._log("File Validation")
+            self._log("=" * 80)
+            self._log(f"✅ Found: {validation.present_count} files")
+            self._log(f"📦 Total size: {validation.total_size_readable}")
             
-            if validation['missing_files']:
-                print(f"⚠️  Missing: {len(validation['missing_files'])} files")
-                for missing in validation['missing_files']:
-                    print(f"   - {missing['name']} ({missing['category']})")
+            if not validation.all_present:
+                self._log(f"⚠️  Missing: {validation.missing_count} files")
+                for filename, category in validation.iter_missing():
+                    self._log(f"   - {filename} ({category})")
             
-            print()
+            self._log()
+            self._flush_log()
             
             # Step 3: Create ZIP package
             zip_path = self.create_zip_package(validation)
             
             if not zip_path:
-                print("\n❌ Failed to create ZIP package")
+                self._log("\n❌ Failed to create ZIP package")
+                self._flush_log()
                 return 1
             
             # Step 4: Display success message
-            print("=" * 80)
-            print("✅ ZIP PACKAGE CREATED SUCCESSFULLY")
-            print("=" * 80)
-            print()
-            print(f"📦 Package: {zip_path}")
-            print(f"📏 Size: {self.format_size(zip_path.stat().st_size)}")
-            print(f"📁 Location: {self.output_dir}")
-            print()
-            print("Contents:")
-            print(f"  - {len(validation['present_files'])} knowledge base files")
-            print("  - GPT configuration files")
-            print("  - Deployment guides and instructions")
-            print("  - README.txt with quick start guide")
-            print("  - MANIFEST.json with complete file listing")
-            print()
-            print("=" * 80)
-            print("NEXT STEPS")
-            print("=" * 80)
-            print()
-            print("1. Download or extract the ZIP file")
-            print("2. Read README.txt for quick start instructions")
-            print("3. Follow GPT_Deploy_Package/DEPLOYMENT_GUIDE.md for detailed steps")
-            print("4. Deploy to OpenAI GPT Builder: https://chat.openai.com/gpts/editor")
-            print()
-            print("The ZIP package contains everything needed for GPT deployment!")
-            print()
+            self._log("=" * 80)
+            self._log("✅ ZIP PACKAGE CREATED SUCCESSFULLY")
+            self._log("=" * 80)
+            self._log()
+            self._log(f"📦 Package: {zip_path}")
+            self._log(f"📏 Size: {self.format_size(zip_path.stat().st_size)}")
+            self._log(f"📁 Location: {self.output_dir}")
+            self._log()
+            self._log("Contents:")
+            self._log(f"  - {validation.present_count} knowledge base files")
+            self._log("  - GPT configuration files")
+            self._log("  - Deployment guides and instructions")
+            self._log("  - README.txt with quick start guide")
+            self._log("  - MANIFEST.json with complete file listing")
+            self._log()
+            self._log("=" * 80)
+            self._log("NEXT STEPS")
+            self._log("=" * 80)
+            self._log()
+            self._log("1. Download or extract the ZIP file")
+            self._log("2. Read README.txt for quick start instructions")
+            self._log("3. Follow GPT_Deploy_Package/DEPLOYMENT_GUIDE.md for detailed steps")
+            self._log("4. Deploy to OpenAI GPT Builder: https://chat.openai.com/gpts/editor")
+            self._log()
+            self._log("The ZIP package contains everything needed for GPT deployment!")
+            self._log()
+            self._flush_log()
             
             return 0
             
         except Exception as e:
+            self._flush_log()
             print(f"\n❌ Error: {e}", file=sys.stderr)
             import traceback
             traceback.print_exc()
@@ -10,17 +10,104 @@ Usage:
 """
 
 import argparse
+import functools
 import hashlib
 import json
 import os
+import random
 import shutil
+import stat
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Read size for the chunked hashing fallback (Python < 3.11)
+HASH_CHUNK_SIZE = 1 << 16
+
+# Worker threads for hashing KB files
+HASH_WORKERS = min(8, os.cpu_count() or 4)
+
+# Concurrent Files API uploads
+UPLOAD_WORKERS = 8
+
+# Config fields that affect the assistant, with their defaults when absent
+CONFIG_HASH_FIELDS = (
+    ("actions", []),
+    ("business_rules_v6", {}),
+    ("capabilities", {}),
+    ("conversation_starters", []),
+    ("description", ""),
+    ("instructions", ""),
+    ("name", ""),
+)
+
+# Vector store readiness polling: exponential backoff between these bounds
+VS_POLL_INITIAL_DELAY = 0.5
+VS_POLL_MAX_DELAY = 10.0
+
+
+@functools.lru_cache(maxsize=1)
+def _get_openai_cls():
+    """Import the OpenAI client class on first use and return it."""
+    from openai import OpenAI
+    return OpenAI
+
+
+def _build_http_client():
+    """Build the pooled HTTP client shared by the OpenAI client's requests.
+
+    The pool keeps one warm connection per upload worker, and uses HTTP/2
+    when the optional h2 package is installed.
+    """
+    import httpx
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+    return httpx.Client(
+        http2=http2,
+        limits=httpx.Limits(max_connections=2 * UPLOAD_WORKERS, max_keepalive_connections=2 * UPLOAD_WORKERS),
+        timeout=httpx.Timeout(600.0, connect=5.0),
+        follow_redirects=True,
+    )
+
+
+def _canonical_json(value: Any) -> bytes:
+    """Serialize a value as compact, key-sorted UTF-8 JSON for hashing."""
+    if HAS_ORJSON:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _load_json_file(path: Path) -> Any:
+    """Read and parse a JSON file."""
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _sha256_file(filepath: Path) -> str:
+    """Return the SHA-256 hex digest of a file without reading it all into memory."""
+    with open(filepath, "rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        sha = hashlib.sha256()
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            sha.update(chunk)
+        return sha.hexdigest()
+
 
 class AssistantDeployer:
     """Deploys Panelin GPT configuration as an OpenAI Assistant."""
@@ -53,18 +140,34 @@ class AssistantDeployer:
         self.force = force
         self.config: Dict[str, Any] = {}
         self.client = None
+        # (size, mtime_ns) per KB file, recorded alongside file_hashes
+        self.file_stats: Dict[str, List[int]] = {}
+        # Per-run memoized hashes, reset by load_config()
+        self._config_hash: Optional[str] = None
+        self._file_hashes: Optional[Dict[str, str]] = None
+        self._assistant_params: Optional[Dict[str, Any]] = None
+        self._file_index: Optional[Dict[str, os.stat_result]] = None
 
     def _init_client(self):
         """Initialize OpenAI client."""
         try:
-            from openai import OpenAI
-            self.client = OpenAI(api_key=self.api_key)
+            self.client = _get_openai_cls()(api_key=self.api_key, http_client=_build_http_client())
         except ImportError:
             print("ERROR: openai package not installed. Run: pip install openai>=1.0.0", file=sys.stderr)
             sys.exit(1)
 
+    def _close_client(self) -> None:
+        """Close the OpenAI client and its connection pool."""
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+
     def load_config(self) -> Dict[str, Any]:
         """Load the master GPT configuration."""
+        self._config_hash = None
+        self._file_hashes = None
+        self._assistant_params = None
+        self._file_index = None
         config_path = self.repo_root / self.CONFIG_FILE
         if not config_path.exists():
             raise FileNotFoundError(f"Config not found: {config_path}")
@@ -74,40 +177,99 @@ class AssistantDeployer:
 
     def compute_config_hash(self) -> str:
         """Compute SHA-256 hash of config fields that affect the assistant."""
-        hash_input = json.dumps(
-            {
-                "instructions": self.config.get("instructions", ""),
-                "name": self.config.get("name", ""),
-                "description": self.config.get("description", ""),
-                "capabilities": self.config.get("capabilities", {}),
-                "actions": self.config.get("actions", []),
-                "business_rules_v6": self.config.get("business_rules_v6", {}),
-                "conversation_starters": self.config.get("conversation_starters", []),
-            },
-            sort_keys=True,
-            ensure_ascii=False,
-        )
-        return hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
+        if self._config_hash is not None:
+            return self._config_hash
+        # Hash each field separately so the whole config is never serialized
+        # into one large string
+        digest = hashlib.sha256()
+        for key, default in CONFIG_HASH_FIELDS:
+            digest.update(key.encode("utf-8"))
+            digest.update(b"\x00")
+            digest.update(_canonical_json(self.config.get(key, default)))
+            digest.update(b"\x1e")
+        self._config_hash = digest.hexdigest()
+        return self._config_hash
+
+    def _index_repo_files(self) -> Dict[str, os.stat_result]:
+        """Map each regular file directly under repo_root to its stat result.
+
+        Built with a single scandir pass and cached until the config is reloaded.
+        """
+        if self._file_index is None:
+            with os.scandir(self.repo_root) as it:
+                self._file_index = {entry.name: entry.stat() for entry in it if entry.is_file()}
+        return self._file_index
+
+    def _stat_kb_file(self, filename: str) -> Optional[os.stat_result]:
+        """Return the stat result for a KB file, or None if it does not exist."""
+        if "/" not in filename and os.sep not in filename:
+            return self._index_repo_files().get(filename)
+        try:
+            st = (self.repo_root / filename).stat()
+        except FileNotFoundError:
+            return None
+        return st if stat.S_ISREG(st.st_mode) else None
+
+    def compute_file_hashes(self, current_state: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        """Compute SHA-256 hashes for all KB files to upload.
 
-    def compute_file_hashes(self) -> Dict[str, str]:
-        """Compute SHA-256 hashes for all KB files to upload."""
+        Files whose size and mtime match the stats recorded in current_state
+        reuse the recorded hash instead of being read again. The result is
+        memoized until the config is reloaded.
+        """
+        if self._file_hashes is not None:
+            return self._file_hashes
         files_to_upload = self.config.get("deployment", {}).get("files_to_upload", [])
-        hashes = {}
+        old_hashes = (current_state or {}).get("file_hashes", {})
+        old_stats = (current_state or {}).get("file_stats", {})
+        hashes: Dict[str, Optional[str]] = {}
+        stats = {}
+        to_hash: Dict[str, Path] = {}
         for filename in files_to_upload:
-            filepath = self.repo_root / filename
-            if filepath.exists():
-                sha = hashlib.sha256(filepath.read_bytes()).hexdigest()
-                hashes[filename] = sha
+            st = self._stat_kb_file(filename)
+            if st is None:
+                continue
+            stats[filename] = [st.st_size, st.st_mtime_ns]
+            if filename in old_hashes and old_stats.get(filename) == stats[filename]:
+                hashes[filename] = old_hashes[filename]
+            else:
+                hashes[filename] = None  # keeps files_to_upload order
+                to_hash[filename] = self.repo_root / filename
+
+        # Hash changed files in parallel; hashlib releases the GIL while hashing
+        if to_hash:
+            with ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+                digests = executor.map(_sha256_file, to_hash.values())
+                for filename, sha in zip(to_hash, digests):
+                    hashes[filename] = sha
+        self.file_stats = stats
+        self._file_hashes = hashes
         return hashes
 
+    def compute_deployment_digest(self, current_state: Optional[Dict[str, Any]] = None) -> str:
+        """Compute one SHA-256 over the config hash, KB file hashes and model.
+
+        Two deployments with the same digest would produce the same assistant,
+        so comparing digests replaces comparing each component separately.
+        """
+        digest = hashlib.sha256()
+        digest.update(self.compute_config_hash().encode("ascii"))
+        for filename, sha in sorted(self.compute_file_hashes(current_state).items()):
+            digest.update(b"\0")
+            digest.update(filename.encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(sha.encode("ascii"))
+        digest.update(b"\0\0")
+        digest.update(self.model.encode("utf-8"))
+        return digest.hexdigest()
+
     def load_state(self) -> Optional[Dict[str, Any]]:
         """Load the deployment state file if it exists."""
         state_path = self.repo_root / self.STATE_FILE
         if not state_path.exists():
             return None
         try:
-            with open(state_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return _load_json_file(state_path)
         except (json.JSONDecodeError, IOError):
             print("WARNING: State file corrupted, treating as first deployment")
             return None
@@ -115,6 +277,9 @@ class AssistantDeployer:
     def save_state(self, state: Dict[str, Any]) -> None:
         """Save the deployment state file."""
         state_path = self.repo_root / self.STATE_FILE
+        if HAS_ORJSON:
+            state_path.write_bytes(orjson.dumps(state, option=orjson.OPT_INDENT_2))
+            return
         with open(state_path, "w", encoding="utf-8") as f:
             json.dump(state, f, indent=2, ensure_ascii=False)
 
@@ -125,24 +290,37 @@ class AssistantDeployer:
         if state_path.exists():
             shutil.copy2(state_path, backup_path)
 
-    def _run_validation(self) -> int:
-        """Run the existing file validation script."""
+    def _start_validation(self) -> Optional[subprocess.Popen]:
+        """Start the existing file validation script without waiting for it."""
         validate_script = self.repo_root / "validate_gpt_files.py"
         if not validate_script.exists():
             print("WARNING: validate_gpt_files.py not found, skipping validation")
-            return 0
-        result = subprocess.run(
+            return None
+        return subprocess.Popen(
             [sys.executable, str(validate_script)],
             cwd=str(self.repo_root),
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
         )
-        if result.stdout:
-            print(result.stdout)
-        return result.returncode
+
+    def _finish_validation(self, proc: Optional[subprocess.Popen]) -> int:
+        """Wait for the validation script, print its output and return its exit code."""
+        if proc is None:
+            return 0
+        stdout, _ = proc.communicate()
+        if stdout:
+            print(stdout)
+        return proc.returncode
 
     def map_config_to_assistant_params(self) -> Dict[str, Any]:
-        """Map Panelin config to OpenAI Assistants API parameters."""
+        """Map Panelin config to OpenAI Assistants API parameters.
+
+        The mapping is memoized until the config is reloaded; deploy_assistant
+        adds the per-deployment fields (vector store, deployed_at) to a copy.
+        """
+        if self._assistant_params is not None:
+            return self._assistant_params
         config = self.config
         tools: List[Dict[str, Any]] = []
 
@@ -161,7 +339,7 @@ class AssistantDeployer:
         if len(description) > 512:
             description = description[:509] + "..."
 
-        return {
+        self._assistant_params = {
             "name": config.get("name", "Panelin - BMC Assistant Pro"),
             "description": description,
             "instructions": config.get("instructions", ""),
@@ -171,10 +349,10 @@ class AssistantDeployer:
                 "config_version": config.get("instructions_version", "")[:512],
                 "kb_version": config.get("knowledge_base", {}).get("version", ""),
                 "panelin_version": config.get("metadata", {}).get("panelin_version", ""),
-                "deployed_at": datetime.now(timezone.utc).isoformat(),
                 "config_hash": self.compute_config_hash()[:64],
             },
         }
+        return self._assistant_params
 
     def _map_actions_to_functions(self) -> List[Dict[str, Any]]:
         """Map Wolf API actions to Assistants API function-calling tools."""
@@ -211,21 +389,42 @@ class AssistantDeployer:
             })
         return function_tools
 
+    def _upload_file(self, filepath: Path) -> str:
+        """Upload one KB file via the Files API and return its file ID."""
+        with open(filepath, "rb") as f:
+            uploaded = self.client.files.create(file=f, purpose="assistants")
+        return uploaded.id
+
+    def _index_file_ids(self, file_ids: Dict[str, str]) -> Dict[str, str]:
+        """Map each uploaded file's content hash to its file ID."""
+        hashes = self.compute_file_hashes()
+        return {hashes[filename]: file_id for filename, file_id in file_ids.items() if filename in hashes}
+
     def upload_files(self, current_state: Optional[Dict[str, Any]]) -> Dict[str, str]:
         """Upload KB files via the Files API, skipping unchanged files."""
         files_to_upload = self.config.get("deployment", {}).get("files_to_upload", [])
-        new_hashes = self.compute_file_hashes()
+        new_hashes = self.compute_file_hashes(current_state)
         old_hashes = (current_state or {}).get("file_hashes", {})
         old_file_ids = (current_state or {}).get("file_ids", {})
+        # Content index: files with identical bytes share one uploaded file
+        hash_to_file_id: Dict[str, str] = (
+            {} if self.force else dict((current_state or {}).get("hash_to_file_id", {}))
+        )
 
-        file_ids: Dict[str, str] = {}
+        file_ids: Dict[str, Optional[str]] = {}
         uploaded_count = 0
         skipped_count = 0
         failed_count = 0
 
+        # Plan: decide per file, in order, whether it needs uploading
+        to_upload: List[tuple] = []
+        # sha -> first filename queued for upload in this run, and later
+        # files with the same content that will reuse its file ID
+        queued_by_hash: Dict[str, str] = {}
+        duplicates: List[tuple] = []
         for filename in files_to_upload:
             filepath = self.repo_root / filename
-            if not filepath.exists():
+            if self._stat_kb_file(filename) is None:
                 print(f"  WARNING: {filename} not found, skipping")
                 failed_count += 1
                 continue
@@ -242,22 +441,56 @@ class AssistantDeployer:
                 skipped_count += 1
                 continue
 
+            sha = new_hashes.get(filename)
+            if sha in hash_to_file_id:
+                file_ids[filename] = hash_to_file_id[sha]
+                print(f"  SKIP (same content already uploaded): {filename}")
+                skipped_count += 1
+                continue
+            if sha in queued_by_hash:
+                file_ids[filename] = None  # keeps files_to_upload order
+                duplicates.append((filename, queued_by_hash[sha]))
+                continue
+
             if self.dry_run:
                 file_ids[filename] = f"dry-run-{filename}"
                 print(f"  DRY-RUN would upload: {filename}")
                 uploaded_count += 1
+                hash_to_file_id[sha] = file_ids[filename]
                 continue
 
-            # Upload new file first
-            try:
-                with open(filepath, "rb") as f:
-                    uploaded = self.client.files.create(file=f, purpose="assistants")
-                file_ids[filename] = uploaded.id
-                print(f"  UPLOADED: {filename} -> {uploaded.id}")
-                uploaded_count += 1
-            except Exception as e:
-                print(f"  FAILED: {filename} - {e}")
+            file_ids[filename] = None  # keeps files_to_upload order
+            to_upload.append((filename, filepath))
+            queued_by_hash[sha] = filename
+
+        # Execute: upload concurrently, report results in plan order
+        if to_upload:
+            with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+                futures = [
+                    (filename, executor.submit(self._upload_file, filepath))
+                    for filename, filepath in to_upload
+                ]
+                for filename, future in futures:
+                    try:
+                        file_id = future.result()
+                    except Exception as e:
+                        del file_ids[filename]
+                        print(f"  FAILED: {filename} - {e}")
+                        failed_count += 1
+                        continue
+                    file_ids[filename] = file_id
+                    print(f"  UPLOADED: {filename} -> {file_id}")
+                    uploaded_count += 1
+
+        for filename, original in duplicates:
+            if original not in file_ids:
+                del file_ids[filename]
+                print(f"  FAILED: {filename} - upload of identical {original} failed")
                 failed_count += 1
+                continue
+            file_ids[filename] = file_ids[original]
+            print(f"  SKIP (same content as {original}): {filename}")
+            skipped_count += 1
 
         print(f"\n  Summary: {uploaded_count} uploaded, {skipped_count} unchanged, {failed_count} failed")
         return file_ids
@@ -316,7 +549,8 @@ class AssistantDeployer:
         self, file_ids: Dict[str, str], current_state: Optional[Dict[str, Any]]
     ) -> str:
         """Create or replace a vector store with the uploaded files."""
-        all_file_ids = list(file_ids.values())
+        # Files with identical content share a file ID; attach each once
+        all_file_ids = list(dict.fromkeys(file_ids.values()))
         old_vs_id = (current_state or {}).get("vector_store_id")
         kb_version = self.config.get("knowledge_base", {}).get("version", "?")
 
@@ -330,12 +564,27 @@ class AssistantDeployer:
         
         # Create new vector store using compatibility helper
         vs_api = self._get_vector_stores_api()
-        vs = vs_api.create(name=f"Panelin KB v{kb_version}", file_ids=all_file_ids)
-        vs_id = getattr(vs, "id", None) or (vs.get("id") if isinstance(vs, dict) else None)
-        print(f"  Created vector store: {vs_id}")
+        file_batches = getattr(vs_api, "file_batches", None)
+        if hasattr(file_batches, "create"):
+            # Attach the files as one batch, then wait with the same backoff
+            # and deadline as below; a batch still running at the deadline
+            # is cancelled so it does not keep processing in the background
+            vs = vs_api.create(name=f"Panelin KB v{kb_version}")
+            vs_id = vs.id
+            print(f"  Created vector store: {vs_id}")
+            batch = file_batches.create(vector_store_id=vs_id, file_ids=all_file_ids)
+            try:
+                self._wait_for_vector_store_ready(vs_id)
+            except TimeoutError:
+                file_batches.cancel(batch.id, vector_store_id=vs_id)
+                raise
+        else:
+            vs = vs_api.create(name=f"Panelin KB v{kb_version}", file_ids=all_file_ids)
+            vs_id = getattr(vs, "id", None) or (vs.get("id") if isinstance(vs, dict) else None)
+            print(f"  Created vector store: {vs_id}")
 
-        # Wait for processing
-        self._wait_for_vector_store_ready(vs_id)
+            # Wait for processing (SDKs without file_batches)
+            self._wait_for_vector_store_ready(vs_id)
 
 
         # NOTE:
@@ -360,6 +609,7 @@ class AssistantDeployer:
         print("  Waiting for vector store processing...", end="", flush=True)
         vs_api = self._get_vector_stores_api()
         start = time.time()
+        delay = VS_POLL_INITIAL_DELAY
         while time.time() - start < timeout:
             vs = vs_api.retrieve(vs_id)
             counts = getattr(vs, "file_counts", None) or (vs.get("file_counts") if isinstance(vs, dict) else None)
@@ -380,7 +630,8 @@ class AssistantDeployer:
                 return
 
             print(".", end="", flush=True)
-            time.sleep(3)
+            time.sleep(delay + random.uniform(0, delay * 0.1))
+            delay = min(VS_POLL_MAX_DELAY, delay * 1.5)
         raise TimeoutError(f"Vector store {vs_id} processing timed out after {timeout}s")
 
 
@@ -390,9 +641,12 @@ class AssistantDeployer:
         """Create or update the assistant. Returns assistant ID."""
         assistant_id = (current_state or {}).get("assistant_id")
 
-        # Attach vector store
-        params["tool_resources"] = {
-            "file_search": {"vector_store_ids": [vector_store_id]},
+        # Attach vector store and stamp the deployment time on a copy, leaving
+        # the memoized mapping untouched
+        params = {
+            **params,
+            "tool_resources": {"file_search": {"vector_store_ids": [vector_store_id]}},
+            "metadata": {**params["metadata"], "deployed_at": datetime.now(timezone.utc).isoformat()},
         }
 
         if self.dry_run:
@@ -499,8 +753,7 @@ class AssistantDeployer:
             print("ERROR: No backup state found (.gpt_assistant_state.json.bak)")
             return 1
 
-        with open(backup_path, "r", encoding="utf-8") as f:
-            old_state = json.load(f)
+        old_state = _load_json_file(backup_path)
 
         print("Restoring from backup state...")
         print(f"  Assistant ID: {old_state.get('assistant_id', 'N/A')}")
@@ -577,6 +830,7 @@ class AssistantDeployer:
 
     def run(self) -> int:
         """Execute the full deployment flow."""
+        validation = None
         try:
             print("=" * 70)
             print("GPT ASSISTANT DEPLOYMENT")
@@ -591,11 +845,11 @@ class AssistantDeployer:
             print(f"  Version: {self.config.get('instructions_version', 'N/A')}")
             print()
 
-            # 2. Validate files
+            # 2. Validate files (runs alongside steps 3-4, collected after step 4)
             print("[2/8] Validating KB files...")
-            validation_result = self._run_validation()
-            if validation_result != 0:
-                print("  WARNING: Validation found issues. Continuing anyway...")
+            validation = self._start_validation()
+            if validation is not None:
+                print("  Running in background")
             print()
 
             # 3. Initialize client
@@ -616,20 +870,30 @@ class AssistantDeployer:
             else:
                 print("  No previous deployment found (first deployment)")
 
+            changed = True
             if not self.force and current_state:
-                current_hash = self.compute_config_hash()
-                current_file_hashes = self.compute_file_hashes()
-                if (
-                    current_state.get("config_hash") == current_hash
-                    and current_state.get("file_hashes") == current_file_hashes
-                    and current_state.get("model") == self.model
-                ):
+                # State written before deployment_digest was recorded counts
+                # as changed, forcing one redeploy that records the digest
+                unchanged = (
+                    "deployment_digest" in current_state
+                    and current_state["deployment_digest"] == self.compute_deployment_digest(current_state)
+                )
+                changed = not unchanged
+                if unchanged:
                     print("  No changes detected. Use --force to deploy anyway.")
-                    return 0
                 else:
                     print("  Changes detected, proceeding with deployment")
             print()
 
+            if validation is not None:
+                print("[2/8] Validation results:")
+                validation_result = self._finish_validation(validation)
+                if validation_result != 0:
+                    print("  WARNING: Validation found issues. Continuing anyway...")
+                print()
+            if not changed:
+                return 0
+
             # Backup state before deployment
             self.backup_state()
 
@@ -676,8 +940,11 @@ class AssistantDeployer:
                 "assistant_id": assistant_id,
                 "vector_store_id": vector_store_id,
                 "file_ids": file_ids,
-                "file_hashes": self.compute_file_hashes(),
+                "file_hashes": self.compute_file_hashes(current_state),
+                "file_stats": self.file_stats,
+                "hash_to_file_id": self._index_file_ids(file_ids),
                 "config_hash": self.compute_config_hash(),
+                "deployment_digest": self.compute_deployment_digest(current_state),
                 "last_deployed": datetime.now(timezone.utc).isoformat(),
                 "model": self.model,
                 "config_version": self.config.get("instructions_version", ""),
@@ -702,6 +969,10 @@ class AssistantDeployer:
             import traceback
             traceback.print_exc()
             return 1
+        finally:
+            if validation is not None and validation.poll() is None:
+                validation.kill()
+                validation.wait()
 
 
 def main():
@@ -752,10 +1023,14 @@ def main():
         force=args.force,
     )
 
-    if args.rollback:
-        sys.exit(deployer.rollback())
-    else:
-        sys.exit(deployer.run())
+    try:
+        if args.rollback:
+            exit_code = deployer.rollback()
+        else:
+            exit_code = deployer.run()
+    finally:
+        deployer._close_client()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
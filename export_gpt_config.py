@@ -9,6 +9,8 @@ an organized ZIP package ready for upload to OpenAI GPT Builder.
 Usage:
     python3 export_gpt_config.py              # export to gpt_config_export/
     python3 export_gpt_config.py -o /tmp/out  # custom output directory
+    python3 export_gpt_config.py --staging-dir  # also write the unpacked phase tree
+    python3 export_gpt_config.py --force        # rebuild even if inputs are unchanged
 
 The script is fully non-interactive and uses only the Python standard library.
 """
@@ -20,6 +22,8 @@ import os
 import shutil
 import sys
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
@@ -67,6 +71,26 @@ PHASE_5_DESC = "Supporting Files"
 PHASE_6_DIR = "Phase_6_Assets"
 PHASE_6_DESC = "Assets & Branding"
 
+# Hierarchy key prefix → phase number, flattened in HIERARCHY_TO_PHASE order
+# so the first matching entry still wins.
+PREFIX_TO_PHASE: Tuple[Tuple[str, int], ...] = tuple(
+    (prefix, phase_num)
+    for prefixes, phase_num, _dir, _desc in HIERARCHY_TO_PHASE
+    for prefix in prefixes
+)
+
+# Phase number → directory name / description.
+PHASE_DIRNAME: Dict[int, str] = {
+    **{phase_num: dirname for _p, phase_num, dirname, _desc in HIERARCHY_TO_PHASE},
+    5: PHASE_5_DIR,
+    6: PHASE_6_DIR,
+}
+PHASE_DESC: Dict[int, str] = {
+    **{phase_num: desc for _p, phase_num, _dir, desc in HIERARCHY_TO_PHASE},
+    5: PHASE_5_DESC,
+    6: PHASE_6_DESC,
+}
+
 # Files that are always required regardless of config references.
 ALWAYS_REQUIRED: List[str] = [
     CONFIG_FILENAME,
@@ -90,6 +114,26 @@ PAUSE_AFTER: Dict[int, str] = {
 
 DEFAULT_OUTPUT_DIR = "gpt_config_export"
 
+# Read size when hashing files (1 MiB).
+HASH_CHUNK_SIZE = 1 << 20
+
+# Worker threads for hashing KB files (hashlib releases the GIL).
+HASH_WORKERS = min(8, os.cpu_count() or 4)
+
+# Deflate level for the export ZIP, as in create_gpt_zip_package.py: about
+# twice as fast as the default (6) on the JSON/Markdown KB.
+ZIP_COMPRESSLEVEL = 3
+
+# Already-compressed formats, stored in the ZIP without deflating again.
+STORED_SUFFIXES: Set[str] = {".png", ".jpg", ".jpeg", ".webp", ".gz", ".zip"}
+
+# Fixed timestamp for every ZIP member, so entry metadata does not depend on
+# when (or from which checkout) the export was built.
+ZIP_DATE_TIME = (2020, 1, 1, 0, 0, 0)
+
+# Records the inputs and checksum of the last export, to skip rebuilding it.
+EXPORT_STAMP_FILENAME = ".export_stamp.json"
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -99,11 +143,24 @@ def sha256_file(path: Path) -> str:
     """Return hex SHA-256 digest of a file."""
     h = hashlib.sha256()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(1 << 16), b""):
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
             h.update(chunk)
     return h.hexdigest()
 
 
+def _try_stat(path: Path) -> Optional[os.stat_result]:
+    """Return the stat result for a path, or None if it does not exist."""
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write a block of lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def format_size(size_bytes: int) -> str:
     """Human-readable file size."""
     for unit in ("B", "KB", "MB", "GB"):
@@ -118,41 +175,68 @@ def format_size(size_bytes: int) -> str:
 # ---------------------------------------------------------------------------
 
 
-def load_config(repo_root: Path) -> Dict[str, Any]:
-    """Load and return Panelin_GPT_config.json."""
-    config_path = repo_root / CONFIG_FILENAME
-    if not config_path.exists():
-        print(f"❌  Config file not found: {config_path}", file=sys.stderr)
-        sys.exit(1)
-    with open(config_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+@dataclass(frozen=True)
+class ConfigView:
+    """The fields of Panelin_GPT_config.json used by the exporter, read once."""
+
+    name: str
+    instructions_version: str
+    kb_version: str
+    hierarchy: Dict[str, Any]
+    deploy_files: Tuple[str, ...]
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ConfigView":
+        knowledge_base = config.get("knowledge_base", {})
+        return cls(
+            name=config.get("name", ""),
+            instructions_version=config.get("instructions_version", ""),
+            kb_version=knowledge_base.get("version", ""),
+            hierarchy=knowledge_base.get("hierarchy", {}),
+            deploy_files=tuple(config.get("deployment", {}).get("files_to_upload", [])),
+        )
 
 
-def collect_files_from_config(config: Dict[str, Any]) -> Dict[int, List[str]]:
+def load_config(repo_root: Path, config_filename: str = CONFIG_FILENAME) -> ConfigView:
+    """
+    Load Panelin_GPT_config.json (or config_filename) and return its ConfigView.
+
+    Raises FileNotFoundError if the config does not exist.
+    """
+    with open(repo_root / config_filename, "r", encoding="utf-8") as f:
+        return ConfigView.from_config(json.load(f))
+
+
+def collect_files_from_config(config: ConfigView) -> Dict[int, List[str]]:
     """
     Derive the complete, deduplicated file list from the config and organise
     it into upload phases.
 
     Returns {phase_number: [filename, ...]} with phases 1-6.
     """
-    hierarchy: Dict[str, List[str]] = (
-        config.get("knowledge_base", {}).get("hierarchy", {})
-    )
-    deploy_files: List[str] = config.get("deployment", {}).get("files_to_upload", [])
+    hierarchy = config.hierarchy
+    deploy_files = config.deploy_files
 
     # --- Step 1: map hierarchy levels → phases ---
     assigned: Set[str] = set()
     phases: Dict[int, List[str]] = {i: [] for i in range(1, 7)}
 
-    for prefixes, phase_num, _dir, _desc in HIERARCHY_TO_PHASE:
-        for key, files in hierarchy.items():
-            if not isinstance(files, list):
-                continue
-            if any(key.startswith(p) for p in prefixes):
-                for fname in files:
-                    if fname not in assigned:
-                        phases[phase_num].append(fname)
-                        assigned.add(fname)
+    # Resolve each key's phase once, then assign phase by phase so a file
+    # listed under several levels lands in the earliest phase
+    levels_by_phase: Dict[int, List[List[str]]] = {}
+    for key, files in hierarchy.items():
+        if not isinstance(files, list):
+            continue
+        phase_num = next((ph for prefix, ph in PREFIX_TO_PHASE if key.startswith(prefix)), None)
+        if phase_num is not None:
+            levels_by_phase.setdefault(phase_num, []).append(files)
+
+    for _prefixes, phase_num, _dir, _desc in HIERARCHY_TO_PHASE:
+        for files in levels_by_phase.get(phase_num, ()):
+            for fname in files:
+                if fname not in assigned:
+                    phases[phase_num].append(fname)
+                    assigned.add(fname)
 
     # --- Step 2: add deployment.files_to_upload extras to Phase 4 (docs) ---
     for fname in deploy_files:
@@ -171,47 +255,45 @@ def collect_files_from_config(config: Dict[str, Any]) -> Dict[int, List[str]]:
         assigned.add(fname)
 
     # --- Step 4: ensure assets are in Phase 6, not elsewhere ---
-    for phase_num in list(phases.keys()):
-        for fname in list(phases[phase_num]):
-            if fname in ASSET_FILES and phase_num != 6:
-                phases[phase_num].remove(fname)
-                if fname not in phases[6]:
-                    phases[6].append(fname)
+    moved = [fname for phase_num in range(1, 6) for fname in phases[phase_num] if fname in ASSET_FILES]
+    if moved:
+        for phase_num in range(1, 6):
+            phases[phase_num] = [fname for fname in phases[phase_num] if fname not in ASSET_FILES]
+        phases[6] = list(dict.fromkeys(phases[6] + moved))
 
     return phases
 
 
 def phase_dirname(phase_num: int) -> str:
     """Return the directory name for a given upload phase."""
-    mapping = {entry[1]: entry[2] for entry in HIERARCHY_TO_PHASE}
-    mapping[5] = PHASE_5_DIR
-    mapping[6] = PHASE_6_DIR
-    return mapping.get(phase_num, f"Phase_{phase_num}")
+    return PHASE_DIRNAME.get(phase_num, f"Phase_{phase_num}")
 
 
 def phase_description(phase_num: int) -> str:
     """Return the description for a given upload phase."""
-    mapping = {entry[1]: entry[3] for entry in HIERARCHY_TO_PHASE}
-    mapping[5] = PHASE_5_DESC
-    mapping[6] = PHASE_6_DESC
-    return mapping.get(phase_num, "")
+    return PHASE_DESC.get(phase_num, "")
 
 
-def validate_and_hash(
+def validate_files(
     repo_root: Path, phases: Dict[int, List[str]]
 ) -> Tuple[List[Dict[str, Any]], List[str]]:
     """
-    Validate that every referenced file exists, compute sizes and hashes.
+    Validate that every referenced file exists and record its size.
+
+    Present records carry "sha256": None until hashed, either by
+    hash_records or while create_export streams them into the ZIP.
 
     Returns (file_records, missing_files).
     """
     records: List[Dict[str, Any]] = []
     missing: List[str] = []
 
+    # One stat per file for existence and size
     for phase_num in sorted(phases):
         for fname in phases[phase_num]:
             fpath = repo_root / fname
-            if not fpath.exists():
+            st = _try_stat(fpath)
+            if st is None:
                 missing.append(fname)
                 records.append(
                     {
@@ -221,25 +303,79 @@ def validate_and_hash(
                         "exists": False,
                     }
                 )
-            else:
-                size = fpath.stat().st_size
-                records.append(
-                    {
-                        "filename": fname,
-                        "phase": phase_num,
-                        "phase_dir": phase_dirname(phase_num),
-                        "exists": True,
-                        "size_bytes": size,
-                        "size_readable": format_size(size),
-                        "sha256": sha256_file(fpath),
-                    }
-                )
+                continue
+            size = st.st_size
+            records.append(
+                {
+                    "filename": fname,
+                    "phase": phase_num,
+                    "phase_dir": phase_dirname(phase_num),
+                    "exists": True,
+                    "size_bytes": size,
+                    "size_readable": format_size(size),
+                    "mtime_ns": st.st_mtime_ns,
+                    "sha256": None,
+                }
+            )
 
     return records, missing
 
 
+def hash_records(repo_root: Path, records: List[Dict[str, Any]]) -> None:
+    """Fill in the SHA-256 of every present record not hashed yet, in parallel."""
+    to_hash = [r for r in records if r["exists"] and r["sha256"] is None]
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+        digests = executor.map(sha256_file, [repo_root / r["filename"] for r in to_hash])
+        for record, digest in zip(to_hash, digests):
+            record["sha256"] = digest
+
+
+def validate_and_hash(
+    repo_root: Path, phases: Dict[int, List[str]]
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Validate that every referenced file exists, compute sizes and hashes.
+
+    Returns (file_records, missing_files).
+    """
+    records, missing = validate_files(repo_root, phases)
+    hash_records(repo_root, records)
+    return records, missing
+
+
+def _write_hashed_member(zf: zipfile.ZipFile, src: Path, arcname: str, size_hint: int) -> Tuple[str, int]:
+    """
+    Stream a file into the archive, hashing it on the way.
+
+    size_hint is the size from validation; ZipFile.open() uses it to decide
+    up front whether the entry needs ZIP64 extensions.
+
+    Returns (sha256_hex, size_bytes), so the file is read exactly once.
+    """
+    zinfo = zipfile.ZipInfo(arcname, date_time=ZIP_DATE_TIME)
+    zinfo.external_attr = 0o644 << 16
+    zinfo.file_size = size_hint
+    if src.suffix.lower() in STORED_SUFFIXES:
+        zinfo.compress_type = zipfile.ZIP_STORED
+    else:
+        zinfo.compress_type = zf.compression
+        # Python 3.13 made the level public as ZipInfo.compress_level; older
+        # versions only read the underscored name that ZipFile.write() sets
+        if hasattr(zinfo, "compress_level"):
+            zinfo.compress_level = zf.compresslevel
+        else:
+            zinfo._compresslevel = zf.compresslevel
+    h = hashlib.sha256()
+    with open(src, "rb") as f, zf.open(zinfo, "w") as dst:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+            dst.write(chunk)
+        size = f.tell()
+    return h.hexdigest(), size
+
+
 def build_manifest(
-    config: Dict[str, Any],
+    config: ConfigView,
     records: List[Dict[str, Any]],
     missing: List[str],
 ) -> Dict[str, Any]:
@@ -249,9 +385,9 @@ def build_manifest(
 
     return {
         "package": "Panelin GPT Configuration Export",
-        "gpt_name": config.get("name", ""),
-        "gpt_version": config.get("instructions_version", ""),
-        "kb_version": config.get("knowledge_base", {}).get("version", ""),
+        "gpt_name": config.name,
+        "gpt_version": config.instructions_version,
+        "kb_version": config.kb_version,
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "total_files": len(present),
         "total_size_bytes": total_size,
@@ -274,7 +410,7 @@ def build_manifest(
 
 
 def build_readme(
-    config: Dict[str, Any],
+    config: ConfigView,
     phases: Dict[int, List[str]],
     records: List[Dict[str, Any]],
     missing: List[str],
@@ -287,7 +423,7 @@ def build_readme(
     lines = [
         "=" * 78,
         "PANELIN GPT CONFIGURATION EXPORT",
-        f"  {config.get('name', 'Panelin - BMC Assistant Pro')}",
+        f"  {config.name or 'Panelin - BMC Assistant Pro'}",
         "=" * 78,
         "",
         f"Generated : {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}",
@@ -301,7 +437,7 @@ def build_readme(
         "1. Open OpenAI GPT Builder:  https://chat.openai.com/gpts/editor",
         "2. Create a new GPT (or edit an existing one).",
         "3. Configure:",
-        f"   - Name: {config.get('name', '')}",
+        f"   - Name: {config.name}",
         "   - Description: copy from Panelin_GPT_config.json",
         "   - Instructions: copy from Panelin_GPT_config.json",
         "4. Enable capabilities: Web Browsing, Code Interpreter, Image Generation.",
@@ -379,16 +515,32 @@ def build_readme(
     return "\n".join(lines) + "\n"
 
 
+def _write_bytes_member(zf: zipfile.ZipFile, arcname: str, data: bytes) -> None:
+    """Add in-memory content to the archive as a deflated, 0644 file."""
+    zinfo = zipfile.ZipInfo(arcname, date_time=ZIP_DATE_TIME)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.external_attr = 0o644 << 16
+    zf.writestr(zinfo, data, compresslevel=zf.compresslevel)
+
+
 def create_export(
     repo_root: Path,
     output_dir: Path,
-    config: Dict[str, Any],
+    config: ConfigView,
     phases: Dict[int, List[str]],
     records: List[Dict[str, Any]],
     missing: List[str],
+    staging: bool = False,
+    inputs_digest: Optional[str] = None,
 ) -> Optional[Path]:
     """
-    Create the export directory tree and ZIP archive.
+    Create the ZIP archive, streaming each file straight from repo_root.
+
+    Files are hashed while they are written, filling in the "sha256" of
+    their records, and MANIFEST.json is added last. With staging=True the
+    phase directory tree, README.txt and MANIFEST.json are also written to
+    output_dir, as a browsable copy of the package. When inputs_digest is
+    given, it is recorded with the ZIP's checksum for find_current_export.
 
     Returns the path to the generated ZIP, or None on failure.
     """
@@ -397,49 +549,102 @@ def create_export(
         shutil.rmtree(output_dir)
     output_dir.mkdir(parents=True)
 
-    # Copy files into phase subdirectories
+    # Archive members per phase, ordered by name; existence was already
+    # checked by validate_files, so no file is stat'ed again here
+    rec_by_name = {r["filename"]: r for r in records if r["exists"]}
+    phase_members: Dict[int, Dict[str, Dict[str, Any]]] = {}
     for phase_num in sorted(phases):
-        pdir = output_dir / phase_dirname(phase_num)
-        pdir.mkdir(exist_ok=True)
-        for fname in phases[phase_num]:
-            src = repo_root / fname
-            if src.exists():
-                shutil.copy2(src, pdir / Path(fname).name)
-
-    # Write MANIFEST.json
-    manifest = build_manifest(config, records, missing)
-    manifest_path = output_dir / "MANIFEST.json"
-    with open(manifest_path, "w", encoding="utf-8", newline="\n") as f:
-        json.dump(manifest, f, indent=2, ensure_ascii=False)
-
-    # Write README.txt
-    readme = build_readme(config, phases, records, missing)
-    readme_path = output_dir / "README.txt"
-    with open(readme_path, "w", encoding="utf-8", newline="\n") as f:
-        f.write(readme)
+        members = {Path(fname).name: rec_by_name[fname] for fname in phases[phase_num] if fname in rec_by_name}
+        phase_members[phase_num] = dict(sorted(members.items()))
+
+    readme_bytes = build_readme(config, phases, records, missing).encode("utf-8")
+
+    if staging:
+        # Copy files into phase subdirectories
+        for phase_num, members in phase_members.items():
+            pdir = output_dir / phase_dirname(phase_num)
+            pdir.mkdir(exist_ok=True)
+            for name, rec in members.items():
+                shutil.copy2(repo_root / rec["filename"], pdir / name)
+
+        (output_dir / "README.txt").write_bytes(readme_bytes)
 
     # Create ZIP
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     zip_name = f"Panelin_GPT_Config_Export_{timestamp}.zip"
     zip_path = output_dir / zip_name
 
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        # Add README and manifest at the root of the ZIP
-        zf.write(readme_path, "README.txt")
-        zf.write(manifest_path, "MANIFEST.json")
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL) as zf:
+        # Add README at the root of the ZIP
+        _write_bytes_member(zf, "README.txt", readme_bytes)
 
-        # Add phase directories
-        for phase_num in sorted(phases):
+        # Add phase files, hashing each one as it is compressed
+        for phase_num, members in phase_members.items():
             pdir_name = phase_dirname(phase_num)
-            pdir = output_dir / pdir_name
-            if pdir.exists():
-                for item in sorted(pdir.iterdir()):
-                    if item.is_file():
-                        zf.write(item, f"{pdir_name}/{item.name}")
+            for name, rec in members.items():
+                sha, size = _write_hashed_member(
+                    zf, repo_root / rec["filename"], f"{pdir_name}/{name}", rec["size_bytes"]
+                )
+                rec["sha256"] = sha
+                if size != rec["size_bytes"]:
+                    rec["size_bytes"] = size
+                    rec["size_readable"] = format_size(size)
+
+        # Records whose archive name was taken by a later file of the same
+        # name were not streamed; hash them separately
+        hash_records(repo_root, records)
+
+        # Add the manifest last, now that every file is hashed
+        manifest = build_manifest(config, records, missing)
+        manifest_bytes = json.dumps(manifest, indent=2, ensure_ascii=False).encode("utf-8")
+        _write_bytes_member(zf, "MANIFEST.json", manifest_bytes)
+        if staging:
+            (output_dir / "MANIFEST.json").write_bytes(manifest_bytes)
+
+    if inputs_digest is not None:
+        stamp = {"inputs": inputs_digest, "zip": zip_name, "sha256": sha256_file(zip_path)}
+        (output_dir / EXPORT_STAMP_FILENAME).write_text(json.dumps(stamp), encoding="utf-8")
 
     return zip_path
 
 
+def export_inputs_digest(config_path: Path, records: List[Dict[str, Any]], staging: bool) -> str:
+    """
+    Digest everything an export is built from.
+
+    Files are identified by name, phase, size and mtime rather than content,
+    so computing the digest reads no file.
+    """
+    st = config_path.stat()
+    inputs = {
+        "config": [str(config_path), st.st_size, st.st_mtime_ns],
+        "files": [
+            [r["filename"], r["phase"], r.get("size_bytes"), r.get("mtime_ns")] for r in records
+        ],
+        "staging": staging,
+        "compresslevel": ZIP_COMPRESSLEVEL,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def find_current_export(output_dir: Path, inputs_digest: str) -> Optional[Path]:
+    """
+    Return the previous export ZIP if it was built from the same inputs and
+    still matches its recorded checksum, else None.
+    """
+    try:
+        stamp = json.loads((output_dir / EXPORT_STAMP_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    zip_name = stamp.get("zip", "")
+    if stamp.get("inputs") != inputs_digest or not zip_name or Path(zip_name).name != zip_name:
+        return None
+    zip_path = output_dir / zip_name
+    if not zip_path.is_file() or sha256_file(zip_path) != stamp.get("sha256"):
+        return None
+    return zip_path
+
+
 # ---------------------------------------------------------------------------
 # CLI & main
 # ---------------------------------------------------------------------------
@@ -460,6 +665,23 @@ def main(argv: Optional[List[str]] = None) -> int:
         default=CONFIG_FILENAME,
         help=f"Path to GPT config JSON (default: {CONFIG_FILENAME})",
     )
+    parser.add_argument(
+        "--staging-dir",
+        dest="staging",
+        action="store_true",
+        help="Also write the phase directory tree, README.txt and MANIFEST.json to the output directory",
+    )
+    parser.add_argument(
+        "--no-staging-dir",
+        dest="staging",
+        action="store_false",
+        help="Only write the ZIP archive (default)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild the ZIP even if its inputs are unchanged since the last export",
+    )
     args = parser.parse_args(argv)
 
     repo_root = Path(__file__).parent.resolve()
@@ -476,45 +698,54 @@ def main(argv: Optional[List[str]] = None) -> int:
         return 1
 
     # --- Load config ---
-    print()
-    print("=" * 60)
-    print("  GPT Configuration Files Exporter")
-    print("=" * 60)
-    print()
+    _write_lines(["", "=" * 60, "  GPT Configuration Files Exporter", "=" * 60, ""])
 
-    config_path = repo_root / args.config
-    if not config_path.exists():
-        print(f"❌  Config not found: {config_path}", file=sys.stderr)
+    try:
+        config = load_config(repo_root, args.config)
+    except FileNotFoundError:
+        print(f"❌  Config not found: {repo_root / args.config}", file=sys.stderr)
         return 1
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = json.load(f)
-
-    print(f"📄  Config     : {config_path.name}")
-    print(f"📦  GPT name   : {config.get('name', '?')}")
-    print(f"📋  KB version : {config.get('knowledge_base', {}).get('version', '?')}")
-    print()
+    _write_lines(
+        [
+            f"📄  Config     : {Path(args.config).name}",
+            f"📦  GPT name   : {config.name or '?'}",
+            f"📋  KB version : {config.kb_version or '?'}",
+            "",
+        ]
+    )
 
     # --- Collect & validate ---
     phases = collect_files_from_config(config)
-    records, missing = validate_and_hash(repo_root, phases)
+    records, missing = validate_files(repo_root, phases)
     present = [r for r in records if r["exists"]]
     total_size = sum(r["size_bytes"] for r in present)
 
-    print(f"🔍  Files found : {len(present)}")
-    print(f"📏  Total size  : {format_size(total_size)}")
-
+    lines = [
+        f"🔍  Files found : {len(present)}",
+        f"📏  Total size  : {format_size(total_size)}",
+    ]
     if missing:
-        print(f"⚠️   Missing     : {len(missing)}")
-        for fname in missing:
-            print(f"     ❌  {fname}")
+        lines.append(f"⚠️   Missing     : {len(missing)}")
+        lines.extend(f"     ❌  {fname}" for fname in missing)
     else:
-        print("✅  All files present")
-    print()
+        lines.append("✅  All files present")
+    lines.append("")
 
     # --- Build export ---
-    print(f"📂  Exporting to: {output_dir}")
-    zip_path = create_export(repo_root, output_dir, config, phases, records, missing)
+    lines.append(f"📂  Exporting to: {output_dir}")
+    _write_lines(lines)
+    sys.stdout.flush()
+    inputs_digest = export_inputs_digest(repo_root / args.config, records, args.staging)
+    reused = None if args.force else find_current_export(output_dir, inputs_digest)
+    if reused is not None:
+        zip_path = reused
+        print("♻️   Inputs unchanged since the last export, keeping it (use --force to rebuild)")
+    else:
+        zip_path = create_export(
+            repo_root, output_dir, config, phases, records, missing,
+            staging=args.staging, inputs_digest=inputs_digest,
+        )
 
     if zip_path is None:
         print("❌  Export failed", file=sys.stderr)
@@ -522,27 +753,31 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     # --- Summary ---
     print()
+    rec_by_name = {r["filename"]: r for r in records}
     for phase_num in sorted(phases):
         files = phases[phase_num]
         if not files:
             continue
-        dirname = phase_dirname(phase_num)
-        desc = phase_description(phase_num)
-        print(f"  Phase {phase_num}: {desc}")
+        lines = [f"  Phase {phase_num}: {phase_description(phase_num)}"]
         for fname in files:
-            rec = {r["filename"]: r for r in records}.get(fname, {})
+            rec = rec_by_name.get(fname, {})
             if rec.get("exists"):
-                print(f"    ✅  {fname} ({rec.get('size_readable', '')})")
+                lines.append(f"    ✅  {fname} ({rec.get('size_readable', '')})")
             else:
-                print(f"    ❌  {fname} (MISSING)")
-        print()
-
-    print("=" * 60)
-    print(f"✅  ZIP created: {zip_path.name}")
-    print(f"    Size: {format_size(zip_path.stat().st_size)}")
-    print(f"    Path: {zip_path}")
-    print("=" * 60)
-    print()
+                lines.append(f"    ❌  {fname} (MISSING)")
+        lines.append("")
+        _write_lines(lines)
+
+    _write_lines(
+        [
+            "=" * 60,
+            f"✅  ZIP {'up to date' if reused is not None else 'created'}: {zip_path.name}",
+            f"    Size: {format_size(zip_path.stat().st_size)}",
+            f"    Path: {zip_path}",
+            "=" * 60,
+            "",
+        ]
+    )
 
     return 0
 
@@ -9,6 +9,12 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 ROOT = Path(__file__).resolve().parent.parent
 ARTIFACTS_DIR = ROOT / "artifacts"
 HOT_DIR = ARTIFACTS_DIR / "hot"
@@ -41,15 +47,28 @@ REQUIRED_HOT_FIELDS = [
 
 
 def _sha256_json(data: Any) -> str:
+    if HAS_ORJSON:
+        return hashlib.sha256(orjson.dumps(data, option=orjson.OPT_SORT_KEYS)).hexdigest()
     payload = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
 def _load_json(path: Path) -> Any:
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as handle:
         return json.load(handle)
 
 
+def _write_json(path: Path, data: Any) -> None:
+    if HAS_ORJSON:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n")
+        return
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(data, handle, ensure_ascii=False, indent=2)
+        handle.write("\n")
+
+
 def _parse_shopify(path: Path) -> list[dict[str, Any]]:
     payload = _load_json(path)
     products = payload.get("products_by_handle", {})
@@ -204,16 +223,11 @@ def main() -> None:
 
     for source in SOURCES:
         output_path = HOT_DIR / source.output_file
-        output_records = records_by_source[source.source_file]
-        with output_path.open("w", encoding="utf-8") as handle:
-            json.dump(output_records, handle, ensure_ascii=False, indent=2)
-            handle.write("\n")
+        _write_json(output_path, records_by_source[source.source_file])
 
     manifest = _build_source_manifest(records_by_source)
     manifest_path = ARTIFACTS_DIR / "source_manifest.json"
-    with manifest_path.open("w", encoding="utf-8") as handle:
-        json.dump(manifest, handle, ensure_ascii=False, indent=2)
-        handle.write("\n")
+    _write_json(manifest_path, manifest)
 
     print("Built artifacts:")
     for source in SOURCES:
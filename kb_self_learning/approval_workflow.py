@@ -24,6 +24,18 @@ class ApprovalWorkflow:
     def __init__(self):
         self.pending_queue = {}
         self.approval_history = []
+        # Maintained alongside approval_history so status lookups and stats
+        # don't rescan the whole history on every request
+        self._history_by_id = {}
+        self._decision_counts = {ApprovalStatus.APPROVED: 0, ApprovalStatus.REJECTED: 0}
+
+    def _record_decision(self, entry_id: str, workflow_data: dict) -> None:
+        """Move a decided entry from the queue into the history"""
+        self.approval_history.append(workflow_data)
+        # Keep the first decision, as a scan of the history would find
+        self._history_by_id.setdefault(entry_id, workflow_data)
+        self._decision_counts[workflow_data["status"]] += 1
+        del self.pending_queue[entry_id]
 
     def submit_for_approval(self, entry_id: str, entry_data: dict, submitter: str) -> dict:
         """Submit an entry to the approval queue"""
@@ -59,8 +71,7 @@ class ApprovalWorkflow:
             workflow_data["status"] = ApprovalStatus.APPROVED
             workflow_data["approved_at"] = datetime.now(timezone.utc).isoformat()
 
-            self.approval_history.append(workflow_data)
-            del self.pending_queue[entry_id]
+            self._record_decision(entry_id, workflow_data)
 
             logger.info(f"Entry {entry_id} approved by {reviewer}")
             return {"status": "approved", "entry_id": entry_id}
@@ -83,8 +94,7 @@ class ApprovalWorkflow:
             workflow_data["status"] = ApprovalStatus.REJECTED
             workflow_data["rejected_at"] = datetime.now(timezone.utc).isoformat()
 
-            self.approval_history.append(workflow_data)
-            del self.pending_queue[entry_id]
+            self._record_decision(entry_id, workflow_data)
 
             logger.info(f"Entry {entry_id} rejected by {reviewer}: {reason}")
             return {"status": "rejected", "entry_id": entry_id, "reason": reason}
@@ -119,16 +129,16 @@ class ApprovalWorkflow:
         if entry_id in self.pending_queue:
             return {"status": "in_queue", "data": self.pending_queue[entry_id]}
 
-        for hist in self.approval_history:
-            if hist["entry_id"] == entry_id:
-                return {"status": "processed", "data": hist}
+        hist = self._history_by_id.get(entry_id)
+        if hist is not None:
+            return {"status": "processed", "data": hist}
 
         raise ValueError(f"Entry {entry_id} not found")
 
     def get_approval_stats(self) -> dict:
         """Get approval workflow statistics"""
-        approved = sum(1 for h in self.approval_history if h["status"] == ApprovalStatus.APPROVED)
-        rejected = sum(1 for h in self.approval_history if h["status"] == ApprovalStatus.REJECTED)
+        approved = self._decision_counts[ApprovalStatus.APPROVED]
+        rejected = self._decision_counts[ApprovalStatus.REJECTED]
         pending = len(self.pending_queue)
         decided = approved + rejected
 
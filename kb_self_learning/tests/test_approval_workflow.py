@@ -153,6 +153,19 @@ class TestApprovalWorkflowCore:
         assert status["status"] == "processed"
         assert status["data"]["status"] == ApprovalStatus.APPROVED
 
+    def test_get_entry_status_resubmitted_returns_first_decision(self, workflow):
+        """Test that a resubmitted entry reports its first processed record."""
+        workflow.submit_for_approval("e1", {"topic": "T1"}, "sub1")
+        workflow.approve_entry("e1", "reviewer", "Good")
+        workflow.submit_for_approval("e1", {"topic": "T1 v2"}, "sub1")
+        workflow.reject_entry("e1", "reviewer", "Duplicate")
+
+        status = workflow.get_entry_status("e1")
+
+        assert status["status"] == "processed"
+        assert status["data"]["status"] == ApprovalStatus.APPROVED
+        assert workflow.get_approval_stats()["total_processed"] == 2
+
 
 class TestApprovalStatistics:
     """Test approval statistics calculation."""
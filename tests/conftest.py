@@ -0,0 +1,26 @@
+"""Shared fixtures for the deployment tool tests."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+
+@pytest.fixture
+def touch():
+    """Return a helper that optionally rewrites a file and moves its mtime 1s forward.
+
+    The size/mtime caches under test only rehash a file when one of the two
+    changes, so rewriting with same-size data must also bump the mtime for the
+    change to be seen.
+    """
+    def _touch(path: Path, data: Optional[bytes] = None) -> None:
+        st = path.stat()
+        if data is not None:
+            path.write_bytes(data)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    return _touch
@@ -0,0 +1,105 @@
+"""Tests for the GPT ZIP packager's archive writing and member reuse."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import zipfile
+from pathlib import Path
+
+import pytest
+
+import create_gpt_zip_package
+from create_gpt_zip_package import GPTZipPackager
+
+
+def _make_repo(root: Path) -> dict[str, bytes]:
+    files = {
+        "bom_rules.json": b'{"rules": [' + b'{"sku": "X", "qty": 1},' * 500 + b'{}]}',
+        "README.md": "# Panelin\n\nDocumentación de prueba\n".encode("utf-8") * 50,
+        "bmc_logo.png": os.urandom(4096),
+    }
+    for name, data in files.items():
+        (root / name).write_bytes(data)
+    deploy = root / "GPT_Deploy_Package"
+    deploy.mkdir()
+    (deploy / "DEPLOYMENT_GUIDE.md").write_bytes(b"steps\n" * 100)
+    files["GPT_Deploy_Package/DEPLOYMENT_GUIDE.md"] = b"steps\n" * 100
+    return files
+
+
+def _build(root: Path, zip_filename: str) -> Path:
+    packager = GPTZipPackager(root)
+    packager.zip_filename = zip_filename
+    validation = packager.validate_files(packager.get_all_required_files())
+    zip_path = packager.create_zip_package(validation)
+    assert zip_path is not None
+    return zip_path
+
+
+def _members_by_basename(zip_path: Path) -> dict[str, bytes]:
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.testzip() is None
+        return {
+            info.filename if info.filename.startswith("GPT_Deploy_Package/")
+            else info.filename.rsplit("/", 1)[-1]: zf.read(info)
+            for info in zf.infolist()
+        }
+
+
+def _assert_unzip_ok(zip_path: Path) -> None:
+    if shutil.which("unzip") is None:
+        return
+    result = subprocess.run(["unzip", "-tq", str(zip_path)], capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+@pytest.mark.parametrize("raw_write", [True, False], ids=["raw", "writestr"])
+def test_package_archive_is_valid(tmp_path, monkeypatch, raw_write):
+    files = _make_repo(tmp_path)
+    if not raw_write:
+        # As on a Python whose ZipFile lacks the internals the raw writer uses
+        monkeypatch.setattr(
+            create_gpt_zip_package, "RAW_WRITE_ATTRS",
+            create_gpt_zip_package.RAW_WRITE_ATTRS + ("_missing_attribute",),
+        )
+
+    zip_path = _build(tmp_path, "first.zip")
+
+    members = _members_by_basename(zip_path)
+    for name, data in files.items():
+        assert members[name] == data
+    assert {"README.txt", "MANIFEST.json"} <= members.keys()
+    with zipfile.ZipFile(zip_path) as zf:
+        png = next(i for i in zf.infolist() if i.filename.endswith("bmc_logo.png"))
+        assert png.compress_type == zipfile.ZIP_STORED
+    _assert_unzip_ok(zip_path)
+
+
+@pytest.mark.parametrize("change", ["content", "mtime"])
+def test_rebuild_reuses_unchanged_members_and_picks_up_changes(tmp_path, monkeypatch, touch, change):
+    files = _make_repo(tmp_path)
+    _build(tmp_path, "first.zip")
+
+    target = tmp_path / "bom_rules.json"
+    if change == "content":
+        files["bom_rules.json"] = files["bom_rules.json"].replace(b'"X"', b'"Y"')
+        touch(target, files["bom_rules.json"])
+    else:
+        touch(target)
+
+    compressed = []
+    compress_file = create_gpt_zip_package.compress_file
+    monkeypatch.setattr(
+        create_gpt_zip_package, "compress_file",
+        lambda path, *args: compressed.append(os.path.basename(path)) or compress_file(path, *args),
+    )
+
+    zip_path = _build(tmp_path, "second.zip")
+
+    assert compressed == ["bom_rules.json"]
+    members = _members_by_basename(zip_path)
+    for name, data in files.items():
+        assert members[name] == data
+    _assert_unzip_ok(zip_path)
@@ -0,0 +1,130 @@
+"""Tests for the assistant deployer's KB hash cache and upload dedup."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import deploy_gpt_assistant
+from deploy_gpt_assistant import AssistantDeployer
+
+KB_FILES = {
+    "a.json": b'{"panel": "ISODEC", "price": 10}',
+    "b.json": b'{"panel": "ISOROOF", "price": 20}',
+    "c.json": b'{"panel": "ISODEC", "price": 10}',  # same content as a.json
+}
+
+
+class FakeFiles:
+    def __init__(self):
+        self.uploaded = []
+
+    def create(self, file, purpose):
+        self.uploaded.append(os.path.basename(file.name))
+        return SimpleNamespace(id=f"file-{len(self.uploaded)}")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    config = {"deployment": {"files_to_upload": list(KB_FILES)}}
+    (tmp_path / AssistantDeployer.CONFIG_FILE).write_text(json.dumps(config), encoding="utf-8")
+    for name, data in KB_FILES.items():
+        (tmp_path / name).write_bytes(data)
+    return tmp_path
+
+
+@pytest.fixture
+def hashed(monkeypatch):
+    """Record which files are actually read and hashed."""
+    names = []
+    sha256_file = deploy_gpt_assistant._sha256_file
+
+    def record(path):
+        names.append(Path(path).name)
+        return sha256_file(path)
+
+    monkeypatch.setattr(deploy_gpt_assistant, "_sha256_file", record)
+    return names
+
+
+def _deploy(repo: Path, state=None, force=False):
+    """Run the upload step and return (files API, file IDs, saved state)."""
+    deployer = AssistantDeployer(repo_root=repo, api_key="test", force=force)
+    deployer.client = SimpleNamespace(files=FakeFiles())
+    deployer.load_config()
+    file_ids = deployer.upload_files(state)
+    # Same keys run() persists for the next deployment
+    new_state = {
+        "file_ids": file_ids,
+        "file_hashes": deployer.compute_file_hashes(state),
+        "file_stats": deployer.file_stats,
+        "hash_to_file_id": deployer._index_file_ids(file_ids),
+    }
+    return deployer.client.files, file_ids, new_state
+
+
+def test_identical_content_is_uploaded_once(repo):
+    files, file_ids, _ = _deploy(repo)
+
+    assert sorted(files.uploaded) == ["a.json", "b.json"]
+    assert file_ids["c.json"] == file_ids["a.json"]
+    assert len(set(file_ids.values())) == 2
+
+
+def test_unchanged_files_reuse_hashes_and_file_ids(repo, hashed):
+    _, first_ids, state = _deploy(repo)
+    hashed.clear()
+
+    files, file_ids, _ = _deploy(repo, state)
+
+    assert files.uploaded == []
+    assert hashed == []
+    assert file_ids == first_ids
+
+
+def test_content_change_is_rehashed_and_uploaded(repo, hashed, touch):
+    _, first_ids, state = _deploy(repo)
+    hashed.clear()
+    touch(repo / "b.json", b'{"panel": "ISOROOF", "price": 21}')
+
+    files, file_ids, _ = _deploy(repo, state)
+
+    assert hashed == ["b.json"]
+    assert files.uploaded == ["b.json"]
+    assert file_ids["b.json"] != first_ids["b.json"]
+    assert file_ids["a.json"] == first_ids["a.json"]
+
+
+def test_mtime_change_is_rehashed_but_not_reuploaded(repo, hashed, touch):
+    _, first_ids, state = _deploy(repo)
+    hashed.clear()
+    touch(repo / "b.json")
+
+    files, file_ids, _ = _deploy(repo, state)
+
+    assert hashed == ["b.json"]
+    assert files.uploaded == []
+    assert file_ids == first_ids
+
+
+def test_changed_file_matching_uploaded_content_reuses_its_file_id(repo, touch):
+    _, first_ids, state = _deploy(repo)
+    touch(repo / "b.json", KB_FILES["a.json"])
+
+    files, file_ids, _ = _deploy(repo, state)
+
+    assert files.uploaded == []
+    assert file_ids["b.json"] == first_ids["a.json"]
+
+
+def test_force_uploads_everything_once_per_content(repo):
+    _, _, state = _deploy(repo)
+
+    files, file_ids, _ = _deploy(repo, state, force=True)
+
+    assert sorted(files.uploaded) == ["a.json", "b.json"]
+    assert file_ids["c.json"] == file_ids["a.json"]
@@ -0,0 +1,131 @@
+"""Tests for reusing an unchanged export in export_gpt_config."""
+
+from __future__ import annotations
+
+import json
+import zipfile
+import zlib
+from pathlib import Path
+
+import pytest
+
+from export_gpt_config import (
+    CONFIG_FILENAME,
+    ZIP_COMPRESSLEVEL,
+    collect_files_from_config,
+    create_export,
+    export_inputs_digest,
+    find_current_export,
+    load_config,
+    validate_files,
+)
+
+CONFIG = {
+    "name": "Panelin",
+    "knowledge_base": {
+        "version": "7.0",
+        "hierarchy": {"level_1_master": ["prices.json"], "level_4_docs": ["guide.md"]},
+    },
+    "deployment": {"files_to_upload": ["prices.json", "guide.md"]},
+}
+
+
+@pytest.fixture
+def repo(tmp_path):
+    (tmp_path / CONFIG_FILENAME).write_text(json.dumps(CONFIG), encoding="utf-8")
+    (tmp_path / "prices.json").write_bytes(b'{"ISODEC": 10}')
+    (tmp_path / "guide.md").write_bytes(b"# Guide\n")
+    return tmp_path
+
+
+def _export(repo: Path, staging: bool = False):
+    """Build or reuse the export the way main() does; return (zip path, reused)."""
+    output_dir = repo / "out"
+    config = load_config(repo)
+    phases = collect_files_from_config(config)
+    records, missing = validate_files(repo, phases)
+    digest = export_inputs_digest(repo / CONFIG_FILENAME, records, staging)
+    reused = find_current_export(output_dir, digest)
+    if reused is not None:
+        return reused, True
+    zip_path = create_export(
+        repo, output_dir, config, phases, records, missing, staging=staging, inputs_digest=digest
+    )
+    return zip_path, False
+
+
+def _read_member(zip_path: Path, name: str) -> bytes:
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.testzip() is None
+        return zf.read(next(n for n in zf.namelist() if n.endswith("/" + name)))
+
+
+def test_unchanged_inputs_reuse_previous_zip(repo):
+    first, reused = _export(repo)
+    assert not reused
+
+    second, reused = _export(repo)
+
+    assert reused
+    assert second == first
+
+
+def test_content_change_rebuilds(repo, touch):
+    _export(repo)
+    touch(repo / "prices.json", b'{"ISODEC": 11}')
+
+    zip_path, reused = _export(repo)
+
+    assert not reused
+    assert _read_member(zip_path, "prices.json") == b'{"ISODEC": 11}'
+
+
+def test_mtime_change_rebuilds(repo, touch):
+    _export(repo)
+    touch(repo / "guide.md")
+
+    _, reused = _export(repo)
+
+    assert not reused
+
+
+def test_config_change_rebuilds(repo, touch):
+    _export(repo)
+    config = dict(CONFIG, name="Panelin v2")
+    touch(repo / CONFIG_FILENAME, json.dumps(config).encode("utf-8"))
+
+    _, reused = _export(repo)
+
+    assert not reused
+
+
+def test_staging_change_rebuilds(repo):
+    _export(repo)
+
+    _, reused = _export(repo, staging=True)
+
+    assert not reused
+
+
+def test_modified_zip_is_not_reused(repo):
+    zip_path, _ = _export(repo)
+    with open(zip_path, "ab") as f:
+        f.write(b"\0")
+
+    _, reused = _export(repo)
+
+    assert not reused
+
+
+def test_members_use_the_configured_compress_level(repo):
+    data = b"".join(b"panel %d precio %d\n" % (i, i * 7919 % 1000) for i in range(3000))
+    (repo / "guide.md").write_bytes(data)
+    compressor = zlib.compressobj(ZIP_COMPRESSLEVEL, zlib.DEFLATED, -15)
+    expected = len(compressor.compress(data) + compressor.flush())
+
+    zip_path, _ = _export(repo)
+
+    with zipfile.ZipFile(zip_path) as zf:
+        zinfo = next(i for i in zf.infolist() if i.filename.endswith("/guide.md"))
+        assert zinfo.compress_size == expected
+    assert _read_member(zip_path, "guide.md") == data